@@ -1,20 +1,44 @@
 """form2sdc - Convert forms to SDC4-compliant templates."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "4.4.0"
 
-from form2sdc.types import (
-    ColumnType,
-    Constraint,
-    EnumerationItem,
-    ColumnDefinition,
-    ClusterDefinition,
-    PartyDefinition,
-    AttestationDefinition,
-    AuditDefinition,
-    FormAnalysis,
-)
-from form2sdc.validator import Form2SDCValidator, ValidationResult, ValidationIssue
-from form2sdc.template_builder import TemplateBuilder
+if TYPE_CHECKING:
+    from form2sdc.types import (
+        ColumnType,
+        Constraint,
+        EnumerationItem,
+        ColumnDefinition,
+        ClusterDefinition,
+        PartyDefinition,
+        AttestationDefinition,
+        AuditDefinition,
+        FormAnalysis,
+    )
+    from form2sdc.validator import Form2SDCValidator, ValidationResult, ValidationIssue
+    from form2sdc.template_builder import TemplateBuilder
+
+# Public names resolve on first access (PEP 562), so ``import form2sdc``
+# does not pull in pydantic and PyYAML until they are actually used
+_LAZY_IMPORTS = {
+    "ColumnType": "form2sdc.types",
+    "Constraint": "form2sdc.types",
+    "EnumerationItem": "form2sdc.types",
+    "ColumnDefinition": "form2sdc.types",
+    "ClusterDefinition": "form2sdc.types",
+    "PartyDefinition": "form2sdc.types",
+    "AttestationDefinition": "form2sdc.types",
+    "AuditDefinition": "form2sdc.types",
+    "FormAnalysis": "form2sdc.types",
+    "Form2SDCValidator": "form2sdc.validator",
+    "ValidationResult": "form2sdc.validator",
+    "ValidationIssue": "form2sdc.validator",
+    "TemplateBuilder": "form2sdc.template_builder",
+}
 
 __all__ = [
     "ColumnType",
@@ -31,3 +55,16 @@ __all__ = [
     "ValidationIssue",
     "TemplateBuilder",
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -5,22 +5,305 @@ Gemini-first with a thin FormAnalyzer protocol for swappability.
 
 from __future__ import annotations
 
-import base64
+import functools
+import gzip
+import http.client
 import json
+import queue
 import re
-import urllib.error
+import time
 import urllib.request
 from pathlib import Path
-from typing import Optional, Protocol, runtime_checkable
+from types import MappingProxyType
+from typing import Final, Optional, Protocol, runtime_checkable
+from urllib.parse import unquote, urlsplit
 
 from form2sdc.prompt_loader import load_system_prompt
-from form2sdc.types import FormAnalysis
+from form2sdc.types import FormAnalysis, parse_form_analysis
+
+# Optional speedups: pip install "form2sdc[speedups]"
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pybase64 as base64  # SIMD-accelerated, same API as stdlib
+except ImportError:
+    import base64
 
 # Gemini REST API base URL
 _GEMINI_API_URL = (
     "https://generativelanguage.googleapis.com/v1beta/models"
 )
 
+# Parsed once so the host and path are not re-split on every request
+_GEMINI_API = urlsplit(_GEMINI_API_URL)
+
+# Gemini Files API endpoints (same host as the generation API)
+_GEMINI_UPLOAD_PATH = "/upload/v1beta/files"
+_GEMINI_FILES_PATH = "/v1beta"
+
+# Instructions preceding the JSON schema in the user prompt
+_USER_PROMPT_PREAMBLE = (
+    "Analyze this form and extract its structure. "
+    "Identify all fields, their data types, constraints, "
+    "and relationships. "
+    "Place all data fields in the 'data' section.\n\n"
+    "Return ONLY a JSON object (no markdown fences, "
+    "no commentary) conforming to this schema:\n"
+)
+
+# Markdown code fence the model sometimes wraps JSON output in
+_FENCE_RE = re.compile(r"```(?:json)?\s*\n(.*?)\n\s*```", re.DOTALL)
+
+# Errors raised when the server has dropped an idle keep-alive connection
+# (Windows reports a dropped socket as ConnectionAbortedError)
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+# Transient statuses Gemini returns under load; retried with backoff
+_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+# Upper bound on a single backoff sleep, including server Retry-After
+_MAX_BACKOFF = 60.0
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_schema() -> dict:
+    """JSON schema for FormAnalysis, built once per process."""
+    return FormAnalysis.model_json_schema()
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_schema_json() -> str:
+    """Indented JSON text of the FormAnalysis schema for the prompt."""
+    return json.dumps(_cached_schema(), indent=2)
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_user_prompt() -> str:
+    """User prompt (preamble + schema) without additional instructions."""
+    return _USER_PROMPT_PREAMBLE + _cached_schema_json()
+
+
+def _strip_fences(text: str) -> str:
+    """Strip surrounding whitespace and any markdown code fence."""
+    text = text.strip()
+    if "```" not in text:  # responseMimeType=application/json: usually bare
+        return text
+    fence_match = _FENCE_RE.search(text)
+    if fence_match:
+        return fence_match.group(1)
+    return text
+
+
+def _json_dumps(obj: object) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data: bytes | str) -> object:
+    """Parse JSON from bytes or str (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _encode_request_body(
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float,
+    mime_type: str,
+    inline_data: Optional[bytes] = None,
+    file_uri: Optional[str] = None,
+) -> bytearray:
+    """Assemble the generateContent JSON body in one pre-sized buffer.
+
+    Base64 ``inline_data`` is plain ASCII that needs no JSON escaping, so
+    it is copied into the buffer once instead of passing through a str
+    and the JSON encoder. Pass ``file_uri`` instead for uploaded files.
+    """
+    if inline_data is not None:
+        file_head = (
+            b'{"inlineData":{"mimeType":' + _json_dumps(mime_type)
+            + b',"data":"'
+        )
+        file_tail = b'"}}'
+    else:
+        file_head = _json_dumps(
+            {"fileData": {"mimeType": mime_type, "fileUri": file_uri}}
+        )
+        inline_data = file_tail = b""
+
+    head = (
+        b'{"systemInstruction":{"parts":[{"text":'
+        + _json_dumps(system_prompt)
+        + b'}]},"contents":[{"parts":['
+    )
+    tail = (
+        b',{"text":' + _json_dumps(user_prompt)
+        + b'}]}],"generationConfig":{"temperature":'
+        + _json_dumps(temperature)
+        + b',"responseMimeType":"application/json"}}'
+    )
+
+    pieces = (head, file_head, inline_data, file_tail, tail)
+    buf = bytearray(sum(len(p) for p in pieces))
+    pos = 0
+    for piece in pieces:
+        buf[pos:pos + len(piece)] = piece
+        pos += len(piece)
+    return buf
+
+
+def _read_body(resp: http.client.HTTPResponse) -> bytes | bytearray:
+    """Read a response body, into a pre-sized buffer when the length is known."""
+    length = resp.length
+    if not length:
+        return resp.read()
+    buf = bytearray(length)
+    view = memoryview(buf)
+    pos = 0
+    while pos < length:
+        n = resp.readinto(view[pos:])
+        if not n:
+            raise http.client.IncompleteRead(bytes(buf[:pos]), length - pos)
+        pos += n
+    return buf
+
+
+def _https_proxy_for(host: str) -> Optional[tuple[str, int, dict[str, str]]]:
+    """HTTPS proxy for ``host`` as ``(host, port, CONNECT headers)``.
+
+    Follows the same environment (``HTTPS_PROXY``/``https_proxy``,
+    ``NO_PROXY``) and platform settings as ``urllib.request.urlopen``.
+    Returns None when requests to ``host`` should go direct. A proxy
+    without a port defaults to 443, as with ``urlopen``.
+    """
+    proxy = urllib.request.getproxies().get("https")
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    parts = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    headers = {}
+    if parts.username is not None:
+        credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        headers["Proxy-Authorization"] = "Basic " + base64.b64encode(
+            credentials.encode("utf-8")
+        ).decode("ascii")
+    return parts.hostname, parts.port or http.client.HTTPS_PORT, headers
+
+
+class _ConnectionPool:
+    """Thread-safe pool of keep-alive HTTPS connections to a single host.
+
+    Reusing connections skips the DNS lookup and TCP/TLS handshake on
+    every request after the first. Responses are requested gzip-encoded
+    and transparently decompressed.
+    Connections are tunnelled through the HTTPS proxy configured in the
+    environment, as ``urllib.request.urlopen`` would do.
+    """
+
+    def __init__(self, host: str, maxsize: int = 8, timeout: float = 600) -> None:
+        self._host = host
+        self._timeout = timeout
+        self._proxy = _https_proxy_for(host)
+        self._idle: queue.LifoQueue[http.client.HTTPSConnection] = (
+            queue.LifoQueue(maxsize)
+        )
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: bytes | bytearray,
+        headers: dict[str, str],
+    ) -> tuple[int, http.client.HTTPMessage, bytes | bytearray]:
+        """Send a request and return ``(status, headers, body)``.
+
+        A request on a reused connection that the server has already
+        closed is retried once on a fresh connection.
+        """
+        try:
+            conn, reused = self._idle.get_nowait(), True
+        except queue.Empty:
+            conn, reused = self._new_connection(), False
+
+        try:
+            status, resp_headers, data, will_close = self._send(
+                conn, method, path, body, headers
+            )
+        except _STALE_CONNECTION_ERRORS:
+            conn.close()
+            if not reused:
+                raise
+            conn = self._new_connection()
+            try:
+                status, resp_headers, data, will_close = self._send(
+                    conn, method, path, body, headers
+                )
+            except BaseException:
+                conn.close()
+                raise
+        except BaseException:
+            conn.close()
+            raise
+
+        if will_close:
+            conn.close()
+        else:
+            self._release(conn)
+        return status, resp_headers, data
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _new_connection(self) -> http.client.HTTPSConnection:
+        if self._proxy is None:
+            return http.client.HTTPSConnection(self._host, timeout=self._timeout)
+        # CONNECT through the proxy; TLS is then negotiated with the host
+        proxy_host, proxy_port, proxy_headers = self._proxy
+        conn = http.client.HTTPSConnection(
+            proxy_host, proxy_port, timeout=self._timeout
+        )
+        conn.set_tunnel(self._host, headers=proxy_headers)
+        return conn
+
+    def _release(self, conn: http.client.HTTPSConnection) -> None:
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    @staticmethod
+    def _send(
+        conn: http.client.HTTPSConnection,
+        method: str,
+        path: str,
+        body: bytes | bytearray,
+        headers: dict[str, str],
+    ) -> tuple[int, http.client.HTTPMessage, bytes | bytearray, bool]:
+        conn.request(
+            method, path, body=body,
+            headers={"Accept-Encoding": "gzip", **headers},
+        )
+        resp = conn.getresponse()
+        data = _read_body(resp)
+        if resp.getheader("Content-Encoding", "").lower() == "gzip":
+            data = gzip.decompress(data)
+        return resp.status, resp.headers, data, resp.will_close
+
 
 @runtime_checkable
 class FormAnalyzer(Protocol):
@@ -55,10 +338,14 @@ class GeminiAnalyzer:
 
     Bypasses the google-genai SDK entirely to avoid RecursionError
     from its process_schema on self-referential Pydantic models.
+
+    HTTPS connections are kept alive and reused across ``analyze``
+    calls. Call ``close()`` (or use the analyzer as a context manager)
+    to release them.
     """
 
     # MIME type detection
-    _MIME_MAP = {
+    _MIME_MAP: Final = MappingProxyType({
         ".pdf": "application/pdf",
         ".docx": "application/vnd.openxmlformats-officedocument"
                  ".wordprocessingml.document",
@@ -69,7 +356,7 @@ class GeminiAnalyzer:
         ".webp": "image/webp",
         ".tiff": "image/tiff",
         ".bmp": "image/bmp",
-    }
+    })
 
     def __init__(
         self,
@@ -77,6 +364,10 @@ class GeminiAnalyzer:
         model: str = "gemini-2.5-flash",
         system_prompt: Optional[str] = None,
         temperature: float = 0.1,
+        max_connections: int = 8,
+        upload_threshold: int = 1024 * 1024,
+        max_retries: int = 5,
+        backoff_factor: float = 0.5,
     ) -> None:
         """Initialize GeminiAnalyzer.
 
@@ -84,14 +375,50 @@ class GeminiAnalyzer:
             api_key: Google AI API key.
             model: Gemini model name.
             system_prompt: Override for system prompt
-                (default: load Form2SDCTemplate.md).
+                (default: load Form2SDCTemplate.md on first analyze).
             temperature: Generation temperature
                 (low for faithful extraction).
+            max_connections: Maximum number of idle keep-alive
+                connections to retain.
+            upload_threshold: Files larger than this many bytes are
+                uploaded through the Gemini Files API instead of being
+                sent inline as base64.
+            max_retries: Number of times a request answered with a
+                transient status (429 or 5xx) is retried.
+            backoff_factor: Base delay in seconds for exponential
+                backoff between retries (``backoff_factor * 2**n``).
+                A ``Retry-After`` header from the server takes
+                precedence.
         """
         self._api_key = api_key
         self._model = model
         self._temperature = temperature
-        self._system_prompt = system_prompt or load_system_prompt()
+        self._upload_threshold = upload_threshold
+        self._max_retries = max_retries
+        self._backoff_factor = backoff_factor
+        # Loaded lazily so constructing an analyzer never touches the
+        # filesystem or network (see _system_prompt)
+        self._system_prompt_text = system_prompt or None
+        self._pool = _ConnectionPool(
+            _GEMINI_API.hostname, maxsize=max_connections, timeout=600
+        )
+
+    @property
+    def _system_prompt(self) -> str:
+        """System prompt text, loaded on first use unless overridden."""
+        if self._system_prompt_text is None:
+            self._system_prompt_text = load_system_prompt()
+        return self._system_prompt_text
+
+    def close(self) -> None:
+        """Close any pooled HTTPS connections."""
+        self._pool.close()
+
+    def __enter__(self) -> GeminiAnalyzer:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def analyze(
         self,
@@ -118,9 +445,12 @@ class GeminiAnalyzer:
             if file_content is None:
                 file_content = file_path.read_bytes()
             if mime_type is None:
-                mime_type = self._MIME_MAP.get(
-                    file_path.suffix.lower(), "application/octet-stream"
-                )
+                if file_path.suffix == ".pdf":  # the common case
+                    mime_type = "application/pdf"
+                else:
+                    mime_type = self._MIME_MAP.get(
+                        file_path.suffix.lower(), "application/octet-stream"
+                    )
 
         if file_content is None:
             raise ValueError(
@@ -130,74 +460,63 @@ class GeminiAnalyzer:
         if mime_type is None:
             mime_type = "application/octet-stream"
 
-        # Build the JSON schema for the prompt
-        schema_json = json.dumps(
-            FormAnalysis.model_json_schema(), indent=2
-        )
-
-        user_prompt = (
-            "Analyze this form and extract its structure. "
-            "Identify all fields, their data types, constraints, "
-            "and relationships. "
-            "Place all data fields in the 'data' section.\n\n"
-            "Return ONLY a JSON object (no markdown fences, "
-            "no commentary) conforming to this schema:\n"
-            f"{schema_json}"
-        )
+        # Base prompt + JSON schema is cached; the model never changes
+        user_prompt = _cached_user_prompt()
         if additional_instructions:
-            user_prompt += (
-                f"\n\nAdditional instructions: "
-                f"{additional_instructions}"
+            user_prompt = "".join(
+                (
+                    user_prompt,
+                    "\n\nAdditional instructions: ",
+                    additional_instructions,
+                )
             )
 
-        # Build REST API request body
-        file_b64 = base64.standard_b64encode(file_content).decode("ascii")
-
-        request_body = {
-            "systemInstruction": {
-                "parts": [{"text": self._system_prompt}],
-            },
-            "contents": [
-                {
-                    "parts": [
-                        {
-                            "inlineData": {
-                                "mimeType": mime_type,
-                                "data": file_b64,
-                            },
-                        },
-                        {"text": user_prompt},
-                    ],
-                },
-            ],
-            "generationConfig": {
-                "temperature": self._temperature,
-                "responseMimeType": "application/json",
-            },
-        }
+        # Small files are sent inline as base64. Larger files are uploaded
+        # raw through the Files API and referenced by URI, which avoids
+        # inflating them by a third inside the JSON request body.
+        uploaded_name: Optional[str] = None
+        if len(file_content) > self._upload_threshold:
+            display_name = file_path.name if file_path is not None else "form"
+            uploaded_name, file_uri = self._upload_file(
+                file_content, mime_type, display_name
+            )
+            request_body = _encode_request_body(
+                self._system_prompt,
+                user_prompt,
+                self._temperature,
+                mime_type,
+                file_uri=file_uri,
+            )
+        else:
+            request_body = _encode_request_body(
+                self._system_prompt,
+                user_prompt,
+                self._temperature,
+                mime_type,
+                inline_data=base64.standard_b64encode(file_content),
+            )
 
         # Call the Gemini REST API directly (no SDK)
-        url = (
-            f"{_GEMINI_API_URL}/{self._model}:generateContent"
+        path = (
+            f"{_GEMINI_API.path}/{self._model}:generateContent"
             f"?key={self._api_key}"
         )
-        req = urllib.request.Request(
-            url,
-            data=json.dumps(request_body).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-
         try:
-            with urllib.request.urlopen(req, timeout=600) as resp:
-                response_data = json.loads(
-                    resp.read().decode("utf-8")
-                )
-        except urllib.error.HTTPError as e:
-            body = e.read().decode("utf-8", errors="replace")
-            raise RuntimeError(
-                f"Gemini API error {e.code}: {body}"
-            ) from e
+            status, _, raw = self._request(
+                "POST",
+                path,
+                request_body,
+                {"Content-Type": "application/json"},
+            )
+        finally:
+            if uploaded_name is not None:
+                self._delete_file(uploaded_name)
+
+        if status >= 400:
+            body = raw.decode("utf-8", errors="replace")
+            raise RuntimeError(f"Gemini API error {status}: {body}")
+
+        response_data = _json_loads(raw)
 
         # Extract text from response
         try:
@@ -212,15 +531,106 @@ class GeminiAnalyzer:
             ) from e
 
         # Strip markdown fences if present
-        result_text = result_text.strip()
-        fence_match = re.search(
-            r"```(?:json)?\s*\n(.*?)\n\s*```",
-            result_text,
-            re.DOTALL,
+        result_text = _strip_fences(result_text)
+
+        # Parse and validate in one pass with Pydantic's JSON parser
+        return parse_form_analysis(result_text)
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        body: bytes | bytearray,
+        headers: dict[str, str],
+    ) -> tuple[int, http.client.HTTPMessage, bytes | bytearray]:
+        """Send a request, retrying transient statuses with backoff.
+
+        Retries go through the same pool, so they normally reuse the
+        warm keep-alive connection instead of a fresh TLS handshake.
+        The final response is returned whatever its status.
+        """
+        for attempt in range(self._max_retries + 1):
+            status, resp_headers, raw = self._pool.request(
+                method, path, body, headers
+            )
+            if status not in _RETRY_STATUSES or attempt == self._max_retries:
+                break
+            time.sleep(self._retry_delay(attempt, resp_headers))
+        return status, resp_headers, raw
+
+    def _retry_delay(
+        self, attempt: int, headers: http.client.HTTPMessage
+    ) -> float:
+        """Seconds to wait before retry number ``attempt + 1``."""
+        retry_after = headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), _MAX_BACKOFF)
+            except ValueError:
+                pass  # HTTP-date form; fall back to exponential backoff
+        return min(self._backoff_factor * (2 ** attempt), _MAX_BACKOFF)
+
+    # ── Files API ────────────────────────────────────────────────────
+
+    def _upload_file(
+        self, content: bytes, mime_type: str, display_name: str
+    ) -> tuple[str, str]:
+        """Upload raw bytes via the resumable Files API.
+
+        Returns:
+            Tuple of (file resource name, file URI).
+        """
+        status, headers, raw = self._request(
+            "POST",
+            f"{_GEMINI_UPLOAD_PATH}?key={self._api_key}",
+            _json_dumps({"file": {"display_name": display_name}}),
+            {
+                "Content-Type": "application/json",
+                "X-Goog-Upload-Protocol": "resumable",
+                "X-Goog-Upload-Command": "start",
+                "X-Goog-Upload-Header-Content-Length": str(len(content)),
+                "X-Goog-Upload-Header-Content-Type": mime_type,
+            },
+        )
+        upload_url = headers.get("X-Goog-Upload-URL")
+        if status >= 400 or not upload_url:
+            body = raw.decode("utf-8", errors="replace")
+            raise RuntimeError(f"Gemini upload error {status}: {body}")
+
+        target = urlsplit(upload_url)
+        if target.hostname != _GEMINI_API.hostname:
+            raise RuntimeError(f"Unexpected Gemini upload URL: {upload_url}")
+
+        status, _, raw = self._pool.request(
+            "POST",
+            f"{target.path}?{target.query}",
+            content,
+            {
+                "Content-Length": str(len(content)),
+                "X-Goog-Upload-Offset": "0",
+                "X-Goog-Upload-Command": "upload, finalize",
+            },
         )
-        if fence_match:
-            result_text = fence_match.group(1)
+        if status >= 400:
+            body = raw.decode("utf-8", errors="replace")
+            raise RuntimeError(f"Gemini upload error {status}: {body}")
 
-        # Parse and validate with Pydantic
-        result_data = json.loads(result_text)
-        return FormAnalysis.model_validate(result_data)
+        try:
+            file_info = _json_loads(raw)["file"]
+            return file_info["name"], file_info["uri"]
+        except (KeyError, TypeError, ValueError) as e:
+            raise RuntimeError(
+                f"Unexpected Gemini upload response: {raw[:500]!r}"
+            ) from e
+
+    def _delete_file(self, name: str) -> None:
+        """Delete an uploaded file (best effort; files expire anyway)."""
+        try:
+            self._pool.request(
+                "DELETE",
+                f"{_GEMINI_FILES_PATH}/{name}?key={self._api_key}",
+                b"",
+                {},
+            )
+        except (OSError, http.client.HTTPException):
+            pass
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 from form2sdc.analyzer import FormAnalyzer
-from form2sdc.template_builder import TemplateBuilder
+from form2sdc.template_builder import DEFAULT_BUILDER, TemplateBuilder
 from form2sdc.types import FormAnalysis
 from form2sdc.validator import Form2SDCValidator, ValidationResult
 
@@ -43,7 +44,7 @@ class FormToTemplatePipeline:
         validator: Optional[Form2SDCValidator] = None,
     ) -> None:
         self.analyzer = analyzer
-        self.builder = builder or TemplateBuilder()
+        self.builder = builder or DEFAULT_BUILDER
         self.validator = validator or Form2SDCValidator()
 
     def process(
@@ -85,6 +86,69 @@ class FormToTemplatePipeline:
             validation=validation,
         )
 
+    def process_many(
+        self,
+        file_paths: Iterable[Path],
+        concurrency: int = 8,
+        additional_instructions: str = "",
+        return_exceptions: bool = False,
+    ) -> list[PipelineResult | Exception]:
+        """Run the full pipeline over several forms.
+
+        Analyzer calls are network-bound, so up to ``concurrency`` of them
+        run at once in worker threads; the analyzer must therefore be
+        thread-safe (GeminiAnalyzer is). Building and validating happen
+        in the calling thread because the validator keeps per-call state.
+
+        Every analysis runs to completion even if another one fails.
+        With ``return_exceptions=True`` a failed form's exception takes
+        its place in the returned list, so the successful (and paid for)
+        analyses are kept. Otherwise the first failure in input order is
+        raised once all analyses have finished, and the other results
+        are discarded.
+
+        Args:
+            file_paths: Paths to form files.
+            concurrency: Maximum number of concurrent analyzer calls.
+            additional_instructions: Extra context for the analyzer.
+            return_exceptions: Return analyzer exceptions in place of
+                results instead of raising the first one.
+
+        Returns:
+            PipelineResults (or exceptions, see ``return_exceptions``) in
+            the same order as ``file_paths``.
+        """
+        file_paths = list(file_paths)
+
+        def analyze(path: Path) -> FormAnalysis:
+            return self.analyzer.analyze(
+                file_path=path,
+                additional_instructions=additional_instructions,
+            )
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            futures = [pool.submit(analyze, path) for path in file_paths]
+
+        results: list[PipelineResult | Exception] = []
+        for path, future in zip(file_paths, futures):
+            error = future.exception()
+            if error is not None:
+                if not return_exceptions:
+                    raise error
+                results.append(error)
+                continue
+            analysis = future.result()
+            template = self.builder.build(analysis)
+            validation = self.validator.validate(template, document=str(path))
+            results.append(
+                PipelineResult(
+                    analysis=analysis,
+                    template=template,
+                    validation=validation,
+                )
+            )
+        return results
+
     def process_analysis(self, analysis: FormAnalysis) -> PipelineResult:
         """Build and validate from an existing FormAnalysis (no LLM call).
 
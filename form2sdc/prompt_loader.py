@@ -8,6 +8,7 @@ Searches in order:
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 from typing import Optional
 
@@ -18,9 +19,14 @@ _GITHUB_RAW_URL = (
 )
 
 
+@functools.lru_cache(maxsize=4)
 def load_system_prompt(path: Optional[str | Path] = None) -> str:
     """Load Form2SDCTemplate.md content for use as system prompt.
 
+    Results are cached per ``path``; call
+    ``load_system_prompt.cache_clear()`` to force a reload (e.g. in
+    tests that modify the file).
+
     Args:
         path: Optional explicit path to Form2SDCTemplate.md.
 
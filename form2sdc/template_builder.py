@@ -6,6 +6,11 @@ from structured FormAnalysis data.
 
 from __future__ import annotations
 
+import functools
+import io
+from types import MappingProxyType
+from typing import Final
+
 from form2sdc.types import (
     AttestationDefinition,
     AuditDefinition,
@@ -15,13 +20,90 @@ from form2sdc.types import (
     EnumerationItem,
     FormAnalysis,
     PartyDefinition,
-    resolve_sdc4_type,
+    resolve_sdc4_type_enum,
+)
+
+
+# Lines whose text is fixed by a boolean, rendered once instead of per column
+_REQUIRED_LINES: Final = MappingProxyType({
+    True: "  - required: true\n",
+    False: "  - required: false\n",
+})
+
+
+# Bound once for the list-valued fields (examples, links, media types).
+# str.join already returns a lone str item as-is, so single-item lists
+# need no special case.
+_comma_join: Final = ", ".join
+
+
+# Markdown heading prefix per level ("### " for 3), precomputed for the
+# Markdown heading levels 0-6
+_HEADING_PREFIXES: Final = tuple("#" * level + " " for level in range(7))
+
+
+def _heading_prefix(level: int) -> str:
+    """Heading prefix for ``level``, built directly outside levels 0-6."""
+    if 0 <= level < len(_HEADING_PREFIXES):
+        return _HEADING_PREFIXES[level]
+    return "#" * level + " "
+
+
+# Single-line constraint fields in render order: (attribute, label,
+# check_none). check_none fields are rendered whenever they are set, so
+# 0 still appears; the rest only when truthy. Lists are comma-joined.
+_CONSTRAINT_LINES: Final = (
+    ("pattern", "**Pattern**: ", False),
+    ("min_length", "**Min Length**: ", True),
+    ("max_length", "**Max Length**: ", True),
+    ("min_value", "**Min Magnitude**: ", True),
+    ("max_value", "**Max Magnitude**: ", True),
+    ("precision", "**Precision**: ", True),
+    ("fraction_digits", "**Fraction Digits**: ", True),
+    ("temporal_type", "**Temporal Type**: ", False),
+    ("min_date", "**Min Date**: ", False),
+    ("max_date", "**Max Date**: ", False),
+    ("default_value", "**Default Value**: ", True),
+    ("media_types", "**Media Types**: ", False),
+    ("max_size", "**Max Size**: ", False),
 )
 
 
+@functools.lru_cache(maxsize=256)
+def _constraint_plan(fields_set: frozenset[str]) -> tuple:
+    """Entries of _CONSTRAINT_LINES for the fields set on a Constraint.
+
+    Fields never set still hold their None default and cannot render,
+    so the per-column loop only visits the few that were set. Columns
+    in a form tend to share a handful of constraint shapes.
+    """
+    return tuple(
+        entry for entry in _CONSTRAINT_LINES if entry[0] in fields_set
+    )
+
+
+def _yaml_escape(value: str) -> str:
+    """Escape a value for a YAML double-quoted scalar.
+
+    Backslashes go first so the escapes added after them are not doubled.
+    Chained str.replace beats str.translate here, and plain prose without
+    any of the three characters skips the rewrite entirely.
+    """
+    if "\\" in value:
+        value = value.replace("\\", "\\\\")
+    if '"' in value:
+        value = value.replace('"', '\\"')
+    if "\n" in value:
+        value = value.replace("\n", "\\n")
+    return value
+
+
 class TemplateBuilder:
     """Builds SDC4-compliant markdown templates from FormAnalysis objects."""
 
+    # Stateless; share DEFAULT_BUILDER rather than constructing per call
+    __slots__ = ()
+
     def build(self, analysis: FormAnalysis) -> str:
         """Convert a FormAnalysis to a complete SDC4 markdown template.
 
@@ -43,312 +125,308 @@ class TemplateBuilder:
         Returns:
             Complete markdown string ready for SDCStudio upload.
         """
-        parts: list[str] = []
+        buf = io.StringIO()
+        w = buf.write
 
-        parts.append(self._render_front_matter(analysis))
-        parts.append(self._render_dataset_overview(analysis))
+        self._render_front_matter(buf, analysis)
+        self._render_dataset_overview(buf, analysis)
 
-        # Data section (required)
-        parts.append(self._render_data_section(analysis.data))
+        # Data section (required). Every section from here on is
+        # preceded by a blank line.
+        w("\n")
+        self._render_data_section(buf, analysis.data)
 
         # Subject / Provider / Participation (party sections)
         if analysis.subject:
-            parts.append(self._render_party(analysis.subject, "Subject"))
+            w("\n")
+            self._render_party(buf, analysis.subject, "Subject")
         if analysis.provider:
-            parts.append(self._render_party(analysis.provider, "Provider"))
+            w("\n")
+            self._render_party(buf, analysis.provider, "Provider")
         if analysis.participations:
             for p in analysis.participations:
-                parts.append(self._render_party(p, "Participation"))
+                w("\n")
+                self._render_party(buf, p, "Participation")
 
         # Workflow section
         if analysis.workflow:
-            parts.append(self._render_workflow_section(analysis.workflow))
+            w("\n")
+            self._render_workflow_section(buf, analysis.workflow)
 
         # Attestation section
         if analysis.attestation:
-            parts.append(self._render_attestation(analysis.attestation))
+            w("\n")
+            self._render_attestation(buf, analysis.attestation)
 
         # Audit sections
         if analysis.audit:
             for audit in analysis.audit:
-                parts.append(self._render_audit(audit))
+                w("\n")
+                self._render_audit(buf, audit)
 
         # Links section
         if analysis.links:
-            parts.append(self._render_links(analysis.links))
+            w("\n")
+            self._render_links(buf, analysis.links)
 
-        return "\n".join(parts)
+        return buf.getvalue()
 
     # ── PART 1: YAML Front Matter ────────────────────────────────────
 
-    def _render_front_matter(self, analysis: FormAnalysis) -> str:
-        lines = ["---"]
-        lines.append('template_version: "4.0.0"')
-        lines.append("dataset:")
-        lines.append(f'  name: "{analysis.dataset_name}"')
+    def _render_front_matter(
+        self, buf: io.StringIO, analysis: FormAnalysis
+    ) -> None:
+        w = buf.write
+        w("---\n")
+        w('template_version: "4.0.0"\n')
+        w("dataset:\n")
+        w(f'  name: "{analysis.dataset_name}"\n')
 
         if analysis.dataset_description:
-            # Escape quotes in description
-            desc = analysis.dataset_description.replace('"', '\\"')
-            lines.append(f'  description: "{desc}"')
+            desc = _yaml_escape(analysis.dataset_description)
+            w(f'  description: "{desc}"\n')
 
         if analysis.domain:
-            lines.append(f'  domain: "{analysis.domain}"')
+            w(f'  domain: "{analysis.domain}"\n')
         if analysis.creator:
-            lines.append(f'  creator: "{analysis.creator}"')
+            w(f'  creator: "{analysis.creator}"\n')
 
-        lines.append(f'source_language: "{analysis.source_language}"')
+        w(f'source_language: "{analysis.source_language}"\n')
 
-        lines.append("---")
-        return "\n".join(lines)
+        w("---\n")
 
     # ── PART 2: Dataset Overview ─────────────────────────────────────
 
-    def _render_dataset_overview(self, analysis: FormAnalysis) -> str:
-        lines = [""]
+    def _render_dataset_overview(
+        self, buf: io.StringIO, analysis: FormAnalysis
+    ) -> None:
+        w = buf.write
 
         if analysis.dataset_description:
-            lines.append(f"<!-- Dataset: {analysis.dataset_name} -->")
-            lines.append("")
-            lines.append(analysis.dataset_description)
-            lines.append("")
+            w(f"\n<!-- Dataset: {analysis.dataset_name} -->\n\n")
+            w(analysis.dataset_description)
+            w("\n")
 
         if analysis.purpose:
-            lines.append(f"<!-- Purpose: {analysis.purpose} -->")
-            lines.append("")
+            w(f"\n<!-- Purpose: {analysis.purpose} -->\n")
 
         if analysis.business_context or analysis.primary_use:
-            lines.append("<!-- Business Context:")
+            w("\n<!-- Business Context:\n")
             if analysis.primary_use:
-                lines.append(f"  Primary use: {analysis.primary_use}")
+                w(f"  Primary use: {analysis.primary_use}\n")
             if analysis.secondary_use:
-                lines.append(f"  Secondary use: {analysis.secondary_use}")
+                w(f"  Secondary use: {analysis.secondary_use}\n")
             if analysis.stakeholders:
-                lines.append(f"  Stakeholders: {analysis.stakeholders}")
-            lines.append("-->")
-            lines.append("")
-
-        return "\n".join(lines)
+                w(f"  Stakeholders: {analysis.stakeholders}\n")
+            w("-->\n")
 
     # ── Data section ─────────────────────────────────────────────────
 
-    def _render_data_section(self, cluster: ClusterDefinition) -> str:
-        lines = [f"## Data: {cluster.name}", ""]
-        lines.append("**Type**: Cluster")
+    def _render_data_section(
+        self, buf: io.StringIO, cluster: ClusterDefinition
+    ) -> None:
+        w = buf.write
+        w(f"## Data: {cluster.name}\n\n")
+        w("**Type**: Cluster\n")
 
         if cluster.description:
-            lines.append(f"**Description**: {cluster.description}")
+            w(f"**Description**: {cluster.description}\n")
 
         if cluster.purpose:
-            lines.append(f"**Purpose**: {cluster.purpose}")
+            w(f"**Purpose**: {cluster.purpose}\n")
 
         if cluster.business_context:
-            lines.append(f"**Business Context**: {cluster.business_context}")
+            w(f"**Business Context**: {cluster.business_context}\n")
 
         if cluster.constraints and cluster.constraints.cardinality:
-            lines.append(f"**Cardinality**: {cluster.constraints.cardinality}")
-
-        lines.append("")
+            w(f"**Cardinality**: {cluster.constraints.cardinality}\n")
 
         for col in cluster.columns:
-            lines.append(self._render_column(col, level=3))
-
-        return "\n".join(lines)
+            w("\n")
+            self._render_column(buf, col, level=3)
 
     # ── Party sections ───────────────────────────────────────────────
 
-    def _render_party(self, party: PartyDefinition, section_type: str) -> str:
-        lines = [f"## {section_type}: {party.name}", ""]
+    def _render_party(
+        self, buf: io.StringIO, party: PartyDefinition, section_type: str
+    ) -> None:
+        w = buf.write
+        w(f"## {section_type}: {party.name}\n")
 
         if party.description:
-            lines.append(f"**Description**: {party.description}")
-            lines.append("")
-
-        if section_type == "Participation":
+            w(f"\n**Description**: {party.description}\n")
+
+        if section_type == "Participation" and (
+            party.function
+            or party.function_description
+            or party.mode
+            or party.mode_description
+        ):
+            w("\n")
             if party.function:
-                lines.append(f"**Function**: {party.function}")
+                w(f"**Function**: {party.function}\n")
             if party.function_description:
-                lines.append(
-                    f"**Function Description**: {party.function_description}"
-                )
+                w(f"**Function Description**: {party.function_description}\n")
             if party.mode:
-                lines.append(f"**Mode**: {party.mode}")
+                w(f"**Mode**: {party.mode}\n")
             if party.mode_description:
-                lines.append(f"**Mode Description**: {party.mode_description}")
-            if party.function or party.mode:
-                lines.append("")
+                w(f"**Mode Description**: {party.mode_description}\n")
 
         for col in party.columns:
-            lines.append(self._render_column(col, level=3))
-
-        return "\n".join(lines)
+            w("\n")
+            self._render_column(buf, col, level=3)
 
     # ── Workflow section ─────────────────────────────────────────────
 
-    def _render_workflow_section(self, cluster: ClusterDefinition) -> str:
-        lines = [f"## Workflow: {cluster.name}", ""]
+    def _render_workflow_section(
+        self, buf: io.StringIO, cluster: ClusterDefinition
+    ) -> None:
+        w = buf.write
+        w(f"## Workflow: {cluster.name}\n")
 
         if cluster.description:
-            lines.append(f"**Description**: {cluster.description}")
-            lines.append("")
+            w(f"\n**Description**: {cluster.description}\n")
 
         for col in cluster.columns:
-            lines.append(self._render_column(col, level=3))
-
-        return "\n".join(lines)
+            w("\n")
+            self._render_column(buf, col, level=3)
 
     # ── Attestation section ──────────────────────────────────────────
 
-    def _render_attestation(self, att: AttestationDefinition) -> str:
-        lines = [f"## Attestation: {att.name}", ""]
+    def _render_attestation(
+        self, buf: io.StringIO, att: AttestationDefinition
+    ) -> None:
+        w = buf.write
+        w(f"## Attestation: {att.name}\n\n")
 
         if att.view:
-            lines.append(f"**View**: {att.view}")
+            w(f"**View**: {att.view}\n")
         if att.proof:
-            lines.append(f"**Proof**: {att.proof}")
+            w(f"**Proof**: {att.proof}\n")
         if att.reason:
-            lines.append(f"**Reason**: {att.reason}")
+            w(f"**Reason**: {att.reason}\n")
         if att.committer:
-            lines.append(f"**Committer**: {att.committer}")
-
-        lines.append("")
-        return "\n".join(lines)
+            w(f"**Committer**: {att.committer}\n")
 
     # ── Audit section ────────────────────────────────────────────────
 
-    def _render_audit(self, audit: AuditDefinition) -> str:
-        lines = [f"## Audit: {audit.name}", ""]
+    def _render_audit(
+        self, buf: io.StringIO, audit: AuditDefinition
+    ) -> None:
+        w = buf.write
+        w(f"## Audit: {audit.name}\n\n")
 
         if audit.system_id:
-            lines.append(f"**System ID**: {audit.system_id}")
+            w(f"**System ID**: {audit.system_id}\n")
         if audit.system_user:
-            lines.append(f"**System User**: {audit.system_user}")
+            w(f"**System User**: {audit.system_user}\n")
         if audit.location:
-            lines.append(f"**Location**: {audit.location}")
-
-        lines.append("")
-        return "\n".join(lines)
+            w(f"**Location**: {audit.location}\n")
 
     # ── Links section ────────────────────────────────────────────────
 
-    def _render_links(self, links: list[str]) -> str:
-        lines = ["## Links:", ""]
+    def _render_links(self, buf: io.StringIO, links: list[str]) -> None:
+        w = buf.write
+        w("## Links:\n\n")
         for uri in links:
-            lines.append(f"  - {uri}")
-        lines.append("")
-        return "\n".join(lines)
+            w(f"  - {uri}\n")
 
     # ── Column rendering ─────────────────────────────────────────────
 
-    def _render_column(self, col: ColumnDefinition, level: int = 3) -> str:
-        hashes = "#" * level
-        lines = [f"{hashes} {col.name}", ""]
+    def _render_column(
+        self, buf: io.StringIO, col: ColumnDefinition, level: int = 3
+    ) -> None:
+        w = buf.write
+        w(f"{_heading_prefix(level)}{col.name}\n\n")
 
         # Type (mapped to SDC4) — always first
-        sdc4_type = resolve_sdc4_type(col.column_type.value)
-        lines.append(f"**Type**: {sdc4_type}")
+        sdc4_type = resolve_sdc4_type_enum(col.column_type)
+        w(f"**Type**: {sdc4_type}\n")
 
         # Reuse component reference (after Type)
         if col.reuse_component:
-            lines.append(f"**ReuseComponent**: {col.reuse_component}")
+            w(f"**ReuseComponent**: {col.reuse_component}\n")
 
         # Description
         if col.description:
-            lines.append(f"**Description**: {col.description}")
+            w(f"**Description**: {col.description}\n")
 
         # Units (for quantified types)
         if col.units:
-            lines.append(f"**Units**: {col.units}")
+            w(f"**Units**: {col.units}\n")
 
         # Enumeration
         if col.enumeration:
-            lines.append(self._render_enumeration(col.enumeration))
+            self._render_enumeration(buf, col.enumeration)
 
         # Constraints
         if col.constraints:
-            lines.extend(self._render_constraints(col.constraints, sdc4_type))
+            self._render_constraints(buf, col.constraints, sdc4_type)
 
         # Examples
         if col.examples:
-            lines.append(f"**Examples**: {', '.join(col.examples)}")
+            w(f"**Examples**: {_comma_join(col.examples)}\n")
 
         # Business Rules
         if col.business_rules:
-            lines.append(f"**Business Rules**: {col.business_rules}")
+            w(f"**Business Rules**: {col.business_rules}\n")
 
         # Relationships
         if col.relationships:
-            lines.append(f"**Relationships**: {col.relationships}")
+            w(f"**Relationships**: {col.relationships}\n")
 
         # Semantic Links
         if col.semantic_links:
-            lines.append(
-                f"**Semantic Links**: {', '.join(col.semantic_links)}"
-            )
-
-        lines.append("")
-        return "\n".join(lines)
+            w(f"**Semantic Links**: {_comma_join(col.semantic_links)}\n")
 
     # ── Enumerations ─────────────────────────────────────────────────
 
-    def _render_enumeration(self, items: list[EnumerationItem]) -> str:
-        lines = ["**Enumeration**:"]
+    def _render_enumeration(
+        self, buf: io.StringIO, items: list[EnumerationItem]
+    ) -> None:
+        w = buf.write
+        w("**Enumeration**:\n")
         for item in items:
             if item.description:
-                lines.append(f"  - {item.value}: {item.description}")
+                w(f"  - {item.value}: {item.description}\n")
             elif item.label and item.label != item.value:
-                lines.append(f"  - {item.value}: {item.label}")
+                w(f"  - {item.value}: {item.label}\n")
             else:
-                lines.append(f"  - {item.value}")
-        return "\n".join(lines)
+                w(f"  - {item.value}\n")
 
     # ── Constraints ──────────────────────────────────────────────────
 
     def _render_constraints(
-        self, c, sdc4_type: str
-    ) -> list[str]:
-        lines: list[str] = []
-
-        if c.pattern:
-            lines.append(f"**Pattern**: {c.pattern}")
-        if c.min_length is not None:
-            lines.append(f"**Min Length**: {c.min_length}")
-        if c.max_length is not None:
-            lines.append(f"**Max Length**: {c.max_length}")
-        if c.min_value is not None:
-            lines.append(f"**Min Magnitude**: {c.min_value}")
-        if c.max_value is not None:
-            lines.append(f"**Max Magnitude**: {c.max_value}")
-        if c.precision is not None:
-            lines.append(f"**Precision**: {c.precision}")
-        if c.fraction_digits is not None:
-            lines.append(f"**Fraction Digits**: {c.fraction_digits}")
-        if c.temporal_type:
-            lines.append(f"**Temporal Type**: {c.temporal_type}")
-        if c.min_date:
-            lines.append(f"**Min Date**: {c.min_date}")
-        if c.max_date:
-            lines.append(f"**Max Date**: {c.max_date}")
-        if c.default_value is not None:
-            lines.append(f"**Default Value**: {c.default_value}")
-        if c.media_types:
-            lines.append(f"**Media Types**: {', '.join(c.media_types)}")
-        if c.max_size:
-            lines.append(f"**Max Size**: {c.max_size}")
+        self, buf: io.StringIO, c, sdc4_type: str
+    ) -> None:
+        w = buf.write
+
+        # Pydantic v2 keeps validated field values in __dict__; reading it
+        # by key is about twice as fast as getattr() on the model
+        fields = c.__dict__
+        plan = _constraint_plan(frozenset(c.__pydantic_fields_set__))
+        for attr, label, check_none in plan:
+            value = fields[attr]
+            if (value is not None) if check_none else value:
+                if isinstance(value, list):
+                    value = _comma_join(value)
+                w(f"{label}{value}\n")
 
         # Render general constraints block if needed
-        constraint_items: list[str] = []
-        if c.required is not None:
-            constraint_items.append(
-                f"  - required: {'true' if c.required else 'false'}"
-            )
-        if c.unique is not None and c.unique:
-            constraint_items.append("  - unique: true")
-        if c.format:
-            constraint_items.append(f'  - format: "{c.format}"')
-
-        if constraint_items:
-            lines.append("**Constraints**:")
-            lines.extend(constraint_items)
-
-        return lines
+        if c.required is not None or c.unique or c.format:
+            w("**Constraints**:\n")
+            if c.required is not None:
+                w(_REQUIRED_LINES[c.required])
+            if c.unique:
+                w("  - unique: true\n")
+            if c.format:
+                w(f'  - format: "{c.format}"\n')
+
+
+# Shared instance for callers that do not need a custom builder
+DEFAULT_BUILDER: Final = TemplateBuilder()
+
+
+def build(analysis: FormAnalysis) -> str:
+    """Convert a FormAnalysis to SDC4 markdown using DEFAULT_BUILDER."""
+    return DEFAULT_BUILDER.build(analysis)
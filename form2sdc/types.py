@@ -6,10 +6,13 @@ The template builder handles mapping to SDC4 internal types.
 
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class ColumnType(str, Enum):
@@ -40,8 +43,8 @@ class ColumnType(str, Enum):
     CLUSTER = "Cluster"
 
 
-# Mapping from user-friendly types to SDC4 internal types
-FRIENDLY_TO_SDC4: dict[str, str] = {
+# Mapping from user-friendly types to SDC4 internal types (read-only)
+FRIENDLY_TO_SDC4: Final[Mapping[str, str]] = MappingProxyType({
     "text": "XdString",
     "integer": "XdCount",
     "decimal": "XdQuantity",
@@ -52,7 +55,7 @@ FRIENDLY_TO_SDC4: dict[str, str] = {
     "identifier": "XdString",
     "email": "XdString",
     "url": "XdLink",
-}
+})
 
 
 def resolve_sdc4_type(column_type: str) -> str:
@@ -60,9 +63,29 @@ def resolve_sdc4_type(column_type: str) -> str:
     return FRIENDLY_TO_SDC4.get(column_type, column_type)
 
 
+# Same mapping keyed by enum member, so callers holding a ColumnType skip
+# the .value access and string hashing
+_COLUMN_TYPE_TO_SDC4: dict[ColumnType, str] = {
+    ct: resolve_sdc4_type(ct.value) for ct in ColumnType
+}
+
+
+def resolve_sdc4_type_enum(column_type: ColumnType) -> str:
+    """Resolve a ColumnType member to its SDC4 type."""
+    return _COLUMN_TYPE_TO_SDC4[column_type]
+
+
+# Shared by every model below. Schemas are built on first use rather than
+# at import. pydantic's defaults already give extra="ignore", no
+# assignment validation and no revalidation of instances.
+_MODEL_CONFIG: Final = ConfigDict(defer_build=True)
+
+
 class Constraint(BaseModel):
     """Validation constraints for a column."""
 
+    model_config = _MODEL_CONFIG
+
     required: Optional[bool] = None
     unique: Optional[bool] = None
     min_value: Optional[float] = Field(None, description="Min magnitude/length")
@@ -89,6 +112,8 @@ class Constraint(BaseModel):
 class EnumerationItem(BaseModel):
     """A single enumeration value with optional label and description."""
 
+    model_config = _MODEL_CONFIG
+
     value: str
     label: Optional[str] = None
     description: Optional[str] = None
@@ -97,6 +122,8 @@ class EnumerationItem(BaseModel):
 class ColumnDefinition(BaseModel):
     """A single column/field definition within a cluster."""
 
+    model_config = _MODEL_CONFIG
+
     name: str = Field(..., description="Column name")
     column_type: ColumnType = Field(..., description="Data type")
     description: str = Field("", description="Human-readable description")
@@ -117,6 +144,8 @@ class ColumnDefinition(BaseModel):
 class ClusterDefinition(BaseModel):
     """A flat grouping of columns."""
 
+    model_config = _MODEL_CONFIG
+
     name: str = Field(..., description="Cluster name")
     description: str = Field("", description="What this cluster represents")
     purpose: Optional[str] = None
@@ -128,6 +157,8 @@ class ClusterDefinition(BaseModel):
 class PartyDefinition(BaseModel):
     """A participation party (Subject, Provider, or Participation)."""
 
+    model_config = _MODEL_CONFIG
+
     name: str = Field(..., description="Party name")
     description: str = Field("", description="Role description")
     party_type: str = Field(
@@ -147,6 +178,8 @@ class PartyDefinition(BaseModel):
 class AttestationDefinition(BaseModel):
     """Attestation section — fixed fields from SDC4 model."""
 
+    model_config = _MODEL_CONFIG
+
     name: str
     view: Optional[str] = Field(None, description="Media type for view")
     proof: Optional[str] = Field(None, description="Media type for proof")
@@ -157,6 +190,8 @@ class AttestationDefinition(BaseModel):
 class AuditDefinition(BaseModel):
     """Audit section — fixed fields from SDC4 model."""
 
+    model_config = _MODEL_CONFIG
+
     name: str
     system_id: Optional[str] = Field(None, description="System identifier")
     system_user: Optional[str] = Field(None, description="User description")
@@ -170,6 +205,8 @@ class FormAnalysis(BaseModel):
     The 8 named trees match the SDC4 data model.
     """
 
+    model_config = _MODEL_CONFIG
+
     dataset_name: str = Field(..., description="Name of the dataset/project")
     dataset_description: str = Field("", description="2-4 sentence overview")
     domain: Optional[str] = Field(
@@ -203,3 +240,18 @@ class FormAnalysis(BaseModel):
     links: Optional[list[str]] = Field(
         None, description="URI list for linked resources"
     )
+
+
+@lru_cache(maxsize=1)
+def _form_analysis_json_validator() -> Callable[[str | bytes], FormAnalysis]:
+    # Built on first parse (models use defer_build), then reused
+    return TypeAdapter(FormAnalysis).validate_json
+
+
+def parse_form_analysis(data: str | bytes | bytearray) -> FormAnalysis:
+    """Parse and validate a JSON document into a FormAnalysis.
+
+    Equivalent to ``FormAnalysis.model_validate_json`` but calls the
+    pydantic-core validator directly, skipping the classmethod dispatch.
+    """
+    return _form_analysis_json_validator()(data)
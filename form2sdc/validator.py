@@ -6,15 +6,17 @@ Requires Form2SDCTemplate.md v4.1.0 YAML format with nested dataset object
 
 from __future__ import annotations
 
+import copy
+import functools
 import re
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
 import yaml
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationIssue:
     """A single validation finding."""
 
@@ -29,7 +31,7 @@ class ValidationIssue:
     keyword: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Complete validation output."""
 
@@ -59,8 +61,22 @@ VALID_TYPES = frozenset(
     }
 )
 
+_VALID_TYPES_LISTING = ", ".join(sorted(VALID_TYPES))  # E-CMP-002 message
+
 QUANTIFIED_TYPES = frozenset({"XdCount", "XdQuantity", "XdFloat", "XdDouble"})
 
+# Keywords whose values are parsed with float() once, at ingest
+NUMERIC_KEYWORDS = frozenset(
+    {
+        "Min Magnitude",
+        "Max Magnitude",
+        "Precision",
+        "Fraction Digits",
+        "Min Length",
+        "Max Length",
+    }
+)
+
 # Deprecated keyword aliases
 KEYWORD_ALIASES = {
     "Values": "Enumeration",
@@ -80,20 +96,92 @@ TYPE_SUGGESTIONS = [
 ]
 
 
-@dataclass
+# Case-sensitive ASCII copies of TYPE_SUGGESTIONS for lowercased ASCII
+# names, which skip the regex engine's per-character Unicode case folding
+_ASCII_TYPE_SUGGESTIONS = [
+    (re.compile(pattern.pattern.removeprefix("(?i)"), re.ASCII), suggested_type)
+    for pattern, suggested_type in TYPE_SUGGESTIONS
+]
+
+
+@functools.lru_cache(maxsize=1024)
+def _suggested_type(name: str) -> Optional[str]:
+    """Memoized body of Form2SDCValidator._suggest_type_from_name."""
+    if name.isascii():
+        # Exact for ASCII: (?i) only adds non-ASCII case variants
+        name = name.lower()
+        suggestions = _ASCII_TYPE_SUGGESTIONS
+    else:
+        suggestions = TYPE_SUGGESTIONS
+    for pattern, suggested_type in suggestions:
+        if pattern.search(name):
+            return suggested_type
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_front_matter(block: str) -> tuple[object, Optional[tuple[int, str]]]:
+    """Parse a front matter block, memoized across validate() calls.
+
+    Batches of templates tend to repeat the same front matter. Returns
+    ``(data, None)`` on success or ``(None, (line, message))`` for an
+    E-DOC-002 syntax error. The parsed data is shared between calls and
+    must never be mutated; Form2SDCValidator._parse_yaml hands out a copy.
+    """
+    try:
+        return yaml.safe_load(block), None
+    except yaml.YAMLError as e:
+        line = 2
+        if hasattr(e, "problem_mark") and e.problem_mark is not None:
+            line = e.problem_mark.line + 2  # Adjust for --- line
+        return None, (line, f"Invalid YAML syntax: {e}")
+
+
+# Markdown body line patterns used by _parse_components
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)")
+_BOLD_RE = re.compile(r"^\*\*(.+?)\*\*\s*$")
+_KEYWORD_RE = re.compile(r"^\*\*(.+?)\*\*:\s*(.*)")
+
+# @ProjectName:ComponentLabel reuse reference (E-SYN-003)
+_REF_RE = re.compile(r"^@([A-Za-z0-9_-]+):([A-Za-z0-9_-]+)$")
+
+_NUMBERED_RE = re.compile(r"^\d+\.")  # W-AMB-004
+_CAMEL_RE = re.compile(r"[a-z][A-Z]")  # S-QL-004
+
+
+@functools.lru_cache(maxsize=4096)
+def _regex_error(pattern: str) -> Optional[str]:
+    """Return the compile error for a user Pattern, or None if it is valid.
+
+    Cached so templates that repeat a pattern (or the same template
+    validated again) compile it once, valid or not.
+    """
+    try:
+        re.compile(pattern)
+    except re.error as e:
+        return str(e)
+    return None
+
+
+@dataclass(slots=True)
 class _Component:
-    """Internal representation of a parsed component."""
+    """Internal representation of a parsed component.
+
+    The name and keyword values are stored already stripped.
+    """
 
     name: str
     start_line: int
     keywords: dict[str, _KeywordValue] = field(default_factory=dict)
     keyword_order: list[str] = field(default_factory=list)
+    type_value: Optional[str] = None  # value of **Type**, once seen
 
 
-@dataclass
+@dataclass(slots=True)
 class _KeywordValue:
     value: str
     line: int
+    num: Optional[float] = None  # parsed value of a numeric keyword
 
 
 class Form2SDCValidator:
@@ -194,45 +282,49 @@ class Form2SDCValidator:
     ) -> tuple[Optional[str], str]:
         """Extract YAML front matter and markdown body from content."""
         content = content.lstrip("\ufeff")  # Strip BOM
-        lines = content.split("\n")
-
-        if not lines or lines[0].strip() != "---":
+        first_end = content.find("\n")
+        if first_end == -1 or content[:first_end].strip() != "---":
             return None, content
 
-        # Find closing ---
-        for i in range(1, len(lines)):
-            if lines[i].strip() == "---":
-                self._yaml_end_line = i + 1  # 1-indexed
-                yaml_block = "\n".join(lines[1:i])
-                body = "\n".join(lines[i + 1 :])
-                return yaml_block, body
+        # Find closing ---: the first later line that strips to "---".
+        # Slicing around str.find avoids splitting the whole document.
+        pos = first_end + 1
+        while (idx := content.find("---", pos)) != -1:
+            start = content.rfind("\n", 0, idx) + 1
+            end = content.find("\n", idx)
+            if end == -1:
+                end = len(content)
+            if content[start:end].strip() == "---":
+                # 1-indexed line of the closing delimiter
+                self._yaml_end_line = content.count("\n", 0, start) + 1
+                yaml_block = content[first_end + 1 : max(start - 1, first_end + 1)]
+                return yaml_block, content[end + 1 :]
+            pos = end + 1
 
         return None, content
 
     def _parse_yaml(self, yaml_block: str) -> Optional[dict]:
         """Parse YAML and report errors."""
-        try:
-            result = yaml.safe_load(yaml_block)
-            if not isinstance(result, dict):
-                self._add_error(
-                    "E-DOC-002",
-                    2,
-                    "YAML front matter must be a mapping (key: value pairs)",
-                    fix="Ensure front matter contains key-value pairs like 'dataset:\\n  name: \"My Dataset\"'",
-                )
-                return None
-            return result
-        except yaml.YAMLError as e:
-            line = 2
-            if hasattr(e, "problem_mark") and e.problem_mark is not None:
-                line = e.problem_mark.line + 2  # Adjust for --- line
+        result, syntax_error = _parse_front_matter(yaml_block)
+        if syntax_error is not None:
+            line, message = syntax_error
             self._add_error(
                 "E-DOC-002",
                 line,
-                f"Invalid YAML syntax: {e}",
+                message,
                 fix="Fix YAML syntax errors (check quotes, indentation, colons)",
             )
             return None
+        if not isinstance(result, dict):
+            self._add_error(
+                "E-DOC-002",
+                2,
+                "YAML front matter must be a mapping (key: value pairs)",
+                fix="Ensure front matter contains key-value pairs like 'dataset:\\n  name: \"My Dataset\"'",
+            )
+            return None
+        # Copy so mutations cannot leak into the cached parse
+        return copy.deepcopy(result)
 
     # ── Front matter validation ──────────────────────────────────────
 
@@ -242,9 +334,11 @@ class Form2SDCValidator:
         Requires nested dataset object with name and description fields.
         """
         dataset = fm.get("dataset")
+        if not isinstance(dataset, dict):
+            dataset = {}  # every dataset.* check below then fails
 
         # E-DOC-003: dataset.name required
-        if not isinstance(dataset, dict) or not dataset.get("name"):
+        if not dataset.get("name"):
             self._add_error(
                 "E-DOC-003",
                 2,
@@ -271,14 +365,14 @@ class Form2SDCValidator:
             )
 
         # S-QL-005: Metadata suggestions
-        if not isinstance(dataset, dict) or "description" not in dataset:
+        if "description" not in dataset:
             self._add_suggestion(
                 "S-QL-005",
                 2,
                 "Consider adding a 'dataset.description' field to front matter",
                 fix="Add 'description: \"Brief description\"' under the dataset key",
             )
-        if not isinstance(dataset, dict) or "creator" not in dataset:
+        if "creator" not in dataset:
             self._add_suggestion(
                 "S-QL-005",
                 2,
@@ -302,52 +396,40 @@ class Form2SDCValidator:
         components: list[_Component] = []
         current: Optional[_Component] = None
 
-        heading_re = re.compile(r"^(#{1,6})\s+(.+)")
-        bold_re = re.compile(r"^\*\*(.+?)\*\*\s*$")
-        keyword_re = re.compile(r"^\*\*(.+?)\*\*:\s*(.*)")
-
         lines = markdown_body.split("\n")
         for i, line in enumerate(lines):
             line_num = self._yaml_end_line + i + 1
 
-            # Detect component heading
-            heading_match = heading_re.match(line)
-            bold_match = bold_re.match(line) if not heading_match else None
-
-            if heading_match or bold_match:
+            # All three patterns are anchored at column 0, so prose and
+            # blank lines are skipped on their first character
+            if line.startswith("#"):
+                heading_match = _HEADING_RE.match(line)
+                if not heading_match:
+                    continue
+                name = heading_match.group(2).strip()
                 # Skip party section headings (## Subject:, ## Provider:, ## Participation:)
-                if heading_match:
-                    heading_text = heading_match.group(2).strip()
-                    if any(heading_text.startswith(p) for p in self._SECTION_PREFIXES):
-                        continue
-                # Check if this is actually a keyword line (bold with colon)
-                if bold_match and keyword_re.match(line):
-                    # This is a keyword, not a component name
-                    if current is not None:
-                        kw_match = keyword_re.match(line)
-                        if kw_match:
-                            keyword = kw_match.group(1)
-                            value = kw_match.group(2).strip()
-                            self._process_keyword(current, keyword, value, line_num)
+                if name.startswith(self._SECTION_PREFIXES):
                     continue
-
-                if current is not None:
-                    components.append(current)
-
-                name = (
-                    heading_match.group(2).strip()
-                    if heading_match
-                    else bold_match.group(1).strip()
-                )
-                current = _Component(name=name, start_line=line_num)
-
-            elif keyword_re.match(line):
-                if current is not None:
-                    kw_match = keyword_re.match(line)
-                    if kw_match:
+            elif line.startswith("**"):
+                # Keyword lines (**Name**: value) are checked before bold
+                # names, so "**Type**: **X**" is a keyword, not a component
+                kw_match = _KEYWORD_RE.match(line)
+                if kw_match:
+                    if current is not None:
                         keyword = kw_match.group(1)
                         value = kw_match.group(2).strip()
                         self._process_keyword(current, keyword, value, line_num)
+                    continue
+                bold_match = _BOLD_RE.match(line)
+                if not bold_match:
+                    continue
+                name = bold_match.group(1).strip()
+            else:
+                continue
+
+            if current is not None:
+                components.append(current)
+            current = _Component(name=name, start_line=line_num)
 
         if current is not None:
             components.append(current)
@@ -385,7 +467,18 @@ class Form2SDCValidator:
                 )
             keyword = new_keyword
 
-        component.keywords[keyword] = _KeywordValue(value=value, line=line_num)
+        num = None
+        if value and keyword in NUMERIC_KEYWORDS:
+            try:
+                num = float(value)
+            except ValueError:
+                pass  # Reported by E-SYN-002
+
+        if keyword == "Type":
+            component.type_value = value
+        component.keywords[keyword] = _KeywordValue(
+            value=value, line=line_num, num=num
+        )
         component.keyword_order.append(keyword)
 
     # ── Component validation ─────────────────────────────────────────
@@ -393,7 +486,7 @@ class Form2SDCValidator:
     def _validate_component(self, comp: _Component) -> None:
         """Validate a single component."""
         # E-CMP-004: Component name must be non-empty
-        if not comp.name.strip():
+        if not comp.name:
             self._add_error(
                 "E-CMP-004",
                 comp.start_line,
@@ -404,7 +497,8 @@ class Form2SDCValidator:
             return
 
         # E-CMP-001: Type is required
-        if "Type" not in comp.keywords:
+        type_value = comp.type_value
+        if type_value is None:
             suggestion = self._suggest_type_from_name(comp.name)
             fix = "Add '**Type**: <type>' as the first keyword"
             if suggestion:
@@ -418,8 +512,6 @@ class Form2SDCValidator:
             )
             return
 
-        type_value = comp.keywords["Type"].value.strip()
-
         # Check for component reuse syntax (@Project:Label)
         if type_value.startswith("@"):
             self._validate_component_reference(comp, type_value)
@@ -430,7 +522,7 @@ class Form2SDCValidator:
             self._add_error(
                 "E-CMP-002",
                 comp.keywords["Type"].line,
-                f"Invalid Type '{type_value}' - must be one of: {', '.join(sorted(VALID_TYPES))}",
+                f"Invalid Type '{type_value}' - must be one of: {_VALID_TYPES_LISTING}",
                 fix=f"Change to a valid SDC4 type",
                 component=comp.name,
                 keyword="Type",
@@ -475,7 +567,7 @@ class Form2SDCValidator:
             )
 
         # W-BP-002: Name should be descriptive
-        if len(comp.name.strip()) < 3 and type_value != "Cluster":
+        if len(comp.name) < 3 and type_value != "Cluster":
             self._add_warning(
                 "W-BP-002",
                 comp.start_line,
@@ -498,9 +590,7 @@ class Form2SDCValidator:
         self, comp: _Component, ref: str
     ) -> None:
         """Validate @Project:Label component reuse syntax (E-SYN-003)."""
-        pattern = re.compile(r"^@([A-Za-z0-9_-]+):([A-Za-z0-9_-]+)$")
-        match = pattern.match(ref)
-        if not match:
+        if not _REF_RE.match(ref):
             self._add_error(
                 "E-SYN-003",
                 comp.keywords["Type"].line,
@@ -558,20 +648,16 @@ class Form2SDCValidator:
 
         # E-SYN-002: Numeric values must be valid
         for kw in ("Min Magnitude", "Max Magnitude", "Precision", "Fraction Digits"):
-            if kw in comp.keywords:
-                val = comp.keywords[kw].value.strip()
-                if val:
-                    try:
-                        float(val)
-                    except ValueError:
-                        self._add_error(
-                            "E-SYN-002",
-                            comp.keywords[kw].line,
-                            f"Invalid numeric value '{val}' for **{kw}**",
-                            fix=f"Provide a valid number for **{kw}**",
-                            component=comp.name,
-                            keyword=kw,
-                        )
+            kv = comp.keywords.get(kw)
+            if kv is not None and kv.value and kv.num is None:
+                self._add_error(
+                    "E-SYN-002",
+                    kv.line,
+                    f"Invalid numeric value '{kv.value}' for **{kw}**",
+                    fix=f"Provide a valid number for **{kw}**",
+                    component=comp.name,
+                    keyword=kw,
+                )
 
         # W-BP-004: Magnitude constraints recommended
         if (
@@ -730,7 +816,7 @@ class Form2SDCValidator:
         else:
             # W-AMB-004: Check enumeration ordering
             enum_val = comp.keywords["Enumeration"].value.strip()
-            if enum_val and not re.match(r"^\d+\.", enum_val):
+            if enum_val and not _NUMBERED_RE.match(enum_val):
                 self._add_warning(
                     "W-AMB-004",
                     comp.keywords["Enumeration"].line,
@@ -755,18 +841,18 @@ class Form2SDCValidator:
     def _validate_regex_pattern(self, comp: _Component) -> None:
         """Validate regex pattern syntax (E-BIZ-007)."""
         pattern_val = comp.keywords["Pattern"].value.strip()
-        if pattern_val:
-            try:
-                re.compile(pattern_val)
-            except re.error as e:
-                self._add_error(
-                    "E-BIZ-007",
-                    comp.keywords["Pattern"].line,
-                    f"Invalid regex pattern: {e}",
-                    fix="Fix the regular expression syntax",
-                    component=comp.name,
-                    keyword="Pattern",
-                )
+        if not pattern_val:
+            return
+        error = _regex_error(pattern_val)
+        if error is not None:
+            self._add_error(
+                "E-BIZ-007",
+                comp.keywords["Pattern"].line,
+                f"Invalid regex pattern: {error}",
+                fix="Fix the regular expression syntax",
+                component=comp.name,
+                keyword="Pattern",
+            )
 
     def _validate_numeric_range(
         self,
@@ -776,23 +862,24 @@ class Form2SDCValidator:
         error_code: str,
     ) -> None:
         """Validate that min <= max for a pair of numeric keywords."""
-        if min_kw in comp.keywords and max_kw in comp.keywords:
-            min_val_str = comp.keywords[min_kw].value.strip()
-            max_val_str = comp.keywords[max_kw].value.strip()
-            try:
-                min_val = float(min_val_str)
-                max_val = float(max_val_str)
-                if min_val > max_val:
-                    self._add_error(
-                        error_code,
-                        comp.keywords[max_kw].line,
-                        f"{min_kw} ({min_val_str}) exceeds {max_kw} ({max_val_str})",
-                        fix=f"Ensure {min_kw} is less than or equal to {max_kw}",
-                        component=comp.name,
-                        keyword=max_kw,
-                    )
-            except ValueError:
-                pass  # Caught by E-SYN-002
+        min_kv = comp.keywords.get(min_kw)
+        max_kv = comp.keywords.get(max_kw)
+        if min_kv is None or max_kv is None:
+            return
+        # num is None for empty or unparsable values, caught by E-SYN-002
+        if (
+            min_kv.num is not None
+            and max_kv.num is not None
+            and min_kv.num > max_kv.num
+        ):
+            self._add_error(
+                error_code,
+                max_kv.line,
+                f"{min_kw} ({min_kv.value}) exceeds {max_kw} ({max_kv.value})",
+                fix=f"Ensure {min_kw} is less than or equal to {max_kw}",
+                component=comp.name,
+                keyword=max_kw,
+            )
 
     # ── Cross-component validation ───────────────────────────────────
 
@@ -803,9 +890,9 @@ class Form2SDCValidator:
         so we check all components — not just the first one.
         """
         for comp in self._components:
-            if "Type" not in comp.keywords:
+            type_val = comp.type_value
+            if type_val is None:
                 continue
-            type_val = comp.keywords["Type"].value.strip()
             if type_val == "Cluster" or type_val.startswith("@"):
                 return  # Found a data cluster
         # No Cluster found at all
@@ -821,29 +908,30 @@ class Form2SDCValidator:
         """E-CMP-005: Component names must be unique."""
         seen: dict[str, int] = {}
         for comp in components:
-            name_lower = comp.name.strip().lower()
-            if name_lower in seen:
+            # One probe: components start on distinct lines, so a stored
+            # line other than our own means the name was seen before
+            first_line = seen.setdefault(comp.name.lower(), comp.start_line)
+            if first_line != comp.start_line:
                 self._add_error(
                     "E-CMP-005",
                     comp.start_line,
-                    f"Duplicate component name '{comp.name}' (first defined at line {seen[name_lower]})",
+                    f"Duplicate component name '{comp.name}' (first defined at line {first_line})",
                     fix="Give each component a unique name",
                     component=comp.name,
                 )
-            else:
-                seen[name_lower] = comp.start_line
 
     # ── Context-aware suggestions ────────────────────────────────────
 
     def _add_context_suggestions(self, components: list[_Component]) -> None:
         """Add optimization and quality suggestions."""
         for comp in components:
-            if "Type" not in comp.keywords:
+            type_val = comp.type_value
+            if type_val is None:
                 continue
-            type_val = comp.keywords["Type"].value.strip()
+            keywords = comp.keywords
 
             # S-QL-001: Semantic context for RDF
-            if type_val != "Cluster" and "Semantic Links" not in comp.keywords:
+            if type_val != "Cluster" and "Semantic Links" not in keywords:
                 self._add_suggestion(
                     "S-QL-001",
                     comp.start_line,
@@ -853,10 +941,7 @@ class Form2SDCValidator:
                 )
 
             # S-OPT-001: Examples for complex patterns
-            if (
-                "Pattern" in comp.keywords
-                and "Examples" not in comp.keywords
-            ):
+            if "Pattern" in keywords and "Examples" not in keywords:
                 self._add_suggestion(
                     "S-OPT-001",
                     comp.start_line,
@@ -865,15 +950,20 @@ class Form2SDCValidator:
                     component=comp.name,
                 )
 
-        # S-QL-004: Consistent naming conventions
-        names = [c.name for c in components]
-        has_snake = any("_" in n for n in names)
-        has_camel = any(
-            re.search(r"[a-z][A-Z]", n) for n in names
-        )
-        has_spaces = any(" " in n for n in names)
-        style_count = sum([has_snake, has_camel, has_spaces])
-        if style_count > 1:
+        # S-QL-004: Consistent naming conventions. One pass sets a bit per
+        # style seen (snake, spaces, camel) and stops at the second style.
+        styles = 0
+        for comp in components:
+            name = comp.name
+            if "_" in name:
+                styles |= 1
+            if " " in name:
+                styles |= 2
+            if not styles & 4 and _CAMEL_RE.search(name):
+                styles |= 4
+            if styles & (styles - 1):  # more than one bit set
+                break
+        if styles & (styles - 1):
             self._add_suggestion(
                 "S-QL-004",
                 components[0].start_line,
@@ -885,14 +975,15 @@ class Form2SDCValidator:
 
     def _suggest_type_from_name(self, name: str) -> Optional[str]:
         """Suggest a type based on component name patterns."""
-        for pattern, suggested_type in TYPE_SUGGESTIONS:
-            if pattern.search(name):
-                return suggested_type
-        return None
+        return _suggested_type(name)
 
     def _has_critical_errors(self) -> bool:
         return len(self._errors) > 0
 
+    # The _add_* helpers build ValidationIssue positionally (code, severity,
+    # message, line, column, context, fix, component, keyword): binding nine
+    # keyword arguments costs about twice the rest of the construction.
+
     def _add_error(
         self,
         code: str,
@@ -904,14 +995,7 @@ class Form2SDCValidator:
     ) -> None:
         self._errors.append(
             ValidationIssue(
-                code=code,
-                severity="CRITICAL",
-                message=message,
-                line=line,
-                context="",
-                fix=fix,
-                component=component,
-                keyword=keyword,
+                code, "CRITICAL", message, line, None, "", fix, component, keyword
             )
         )
 
@@ -926,14 +1010,7 @@ class Form2SDCValidator:
     ) -> None:
         self._warnings.append(
             ValidationIssue(
-                code=code,
-                severity="WARNING",
-                message=message,
-                line=line,
-                context="",
-                fix=fix,
-                component=component,
-                keyword=keyword,
+                code, "WARNING", message, line, None, "", fix, component, keyword
             )
         )
 
@@ -948,27 +1025,22 @@ class Form2SDCValidator:
     ) -> None:
         self._suggestions.append(
             ValidationIssue(
-                code=code,
-                severity="SUGGESTION",
-                message=message,
-                line=line,
-                context="",
-                fix=fix,
-                component=component,
-                keyword=keyword,
+                code, "SUGGESTION", message, line, None, "", fix, component, keyword
             )
         )
 
     def _build_result(self, document: str = "") -> ValidationResult:
+        # The issue lists are handed over, not copied: every validate()
+        # call starts with fresh lists, so results never share them.
         return ValidationResult(
             valid=len(self._errors) == 0,
-            errors=list(self._errors),
-            warnings=list(self._warnings),
-            suggestions=list(self._suggestions),
+            errors=self._errors,
+            warnings=self._warnings,
+            suggestions=self._suggestions,
             metadata={
                 "validator": "form2sdc-validator-python",
                 "version": "1.0.0",
-                "validation_time": datetime.now(tz=__import__('datetime').timezone.utc).isoformat(),
+                "validation_time": datetime.now(tz=timezone.utc).isoformat(),
                 "document": document,
                 "total_components": len(self._components),
                 "critical_count": len(self._errors),
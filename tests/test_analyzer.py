@@ -0,0 +1,454 @@
+"""Tests for form2sdc.analyzer helpers (no API key, no network)."""
+
+import base64
+import gzip
+import http.client
+import json
+
+import pytest
+
+from form2sdc import analyzer
+from form2sdc.analyzer import (
+    GeminiAnalyzer,
+    _ConnectionPool,
+    _encode_request_body,
+    _https_proxy_for,
+    _read_body,
+    _strip_fences,
+)
+from form2sdc.prompt_loader import load_system_prompt
+
+
+class TestStripFences:
+    """Test markdown fence removal from model output."""
+
+    def test_bare_json_unchanged(self):
+        assert _strip_fences('  {"a": 1}\n') == '{"a": 1}'
+
+    def test_json_fence(self):
+        assert _strip_fences('```json\n{"a": 1}\n```') == '{"a": 1}'
+
+    def test_plain_fence(self):
+        assert _strip_fences('```\n{"a": 1}\n```') == '{"a": 1}'
+
+    def test_fence_after_preamble(self):
+        text = 'Here is the result:\n```json\n{"a": 1}\n```\n'
+        assert _strip_fences(text) == '{"a": 1}'
+
+
+class TestEncodeRequestBody:
+    """Test the hand-assembled generateContent request body."""
+
+    @pytest.fixture(params=["orjson", "stdlib"])
+    def json_backend(self, request, monkeypatch):
+        if request.param == "stdlib":
+            monkeypatch.setattr(analyzer, "orjson", None)
+        elif analyzer.orjson is None:
+            pytest.skip("orjson not installed")
+
+    def test_inline_data_matches_json_encoding(self, json_backend):
+        content = bytes(range(256)) * 4
+        b64 = base64.standard_b64encode(content)
+        body = _encode_request_body(
+            'System "prompt"\n', "Analyze ü", 0.1, "application/pdf",
+            inline_data=b64,
+        )
+        assert json.loads(body) == {
+            "systemInstruction": {"parts": [{"text": 'System "prompt"\n'}]},
+            "contents": [
+                {
+                    "parts": [
+                        {
+                            "inlineData": {
+                                "mimeType": "application/pdf",
+                                "data": b64.decode("ascii"),
+                            },
+                        },
+                        {"text": "Analyze ü"},
+                    ],
+                },
+            ],
+            "generationConfig": {
+                "temperature": 0.1,
+                "responseMimeType": "application/json",
+            },
+        }
+
+    def test_file_uri(self, json_backend):
+        body = _encode_request_body(
+            "sys", "user", 0.0, "image/png", file_uri="https://x/files/1"
+        )
+        parts = json.loads(body)["contents"][0]["parts"]
+        assert parts[0] == {
+            "fileData": {"mimeType": "image/png", "fileUri": "https://x/files/1"}
+        }
+        assert parts[1] == {"text": "user"}
+
+
+class _FakePool:
+    """Records requests and answers like the Gemini REST endpoints.
+
+    generateContent returns ``result_text`` after serving any queued
+    ``errors``. The Files API start call hands out ``upload_url``; the
+    upload to it returns the file resource, and DELETE succeeds.
+    """
+
+    UPLOAD_URL = "https://generativelanguage.googleapis.com/upload/v1beta/files?upload_id=u1"
+    FILE = {"name": "files/abc", "uri": "https://generativelanguage.googleapis.com/v1beta/files/abc"}
+
+    def __init__(self, result_text, errors=(), upload_url=UPLOAD_URL):
+        self.result_text = result_text
+        self.errors = list(errors)  # (status, headers) served first
+        self.upload_url = upload_url
+        self.requests = []
+
+    def request(self, method, path, body, headers):
+        self.requests.append((method, path, body, headers))
+        if method == "DELETE":
+            return 200, {}, b"{}"
+        if path.startswith("/upload/v1beta/files?key="):
+            return 200, {"X-Goog-Upload-URL": self.upload_url}, b""
+        if "upload_id=" in path:
+            return 200, {}, json.dumps({"file": self.FILE}).encode("utf-8")
+        if self.errors:
+            status, headers = self.errors.pop(0)
+            return status, headers, b'{"error": "busy"}'
+        payload = {"candidates": [{"content": {"parts": [{"text": self.result_text}]}}]}
+        return 200, {}, json.dumps(payload).encode("utf-8")
+
+    def close(self):
+        pass
+
+
+class TestSystemPrompt:
+    """Test lazy loading of the default system prompt."""
+
+    def test_construction_does_not_load_prompt(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            analyzer, "load_system_prompt", lambda: calls.append(1) or "prompt"
+        )
+        gemini = GeminiAnalyzer(api_key="k")
+        assert calls == []
+        assert gemini._system_prompt == gemini._system_prompt == "prompt"
+        assert calls == [1]
+
+    def test_override_never_loads_prompt(self, monkeypatch):
+        monkeypatch.setattr(analyzer, "load_system_prompt", pytest.fail)
+        assert GeminiAnalyzer(api_key="k", system_prompt="sys")._system_prompt == "sys"
+
+    def test_instances_share_cached_prompt(self):
+        load_system_prompt.cache_clear()
+        try:
+            first = GeminiAnalyzer(api_key="k")._system_prompt
+            assert GeminiAnalyzer(api_key="k")._system_prompt is first
+            assert load_system_prompt.cache_info().misses == 1
+        finally:
+            load_system_prompt.cache_clear()
+
+
+class TestAnalyzeInline:
+    """Test analyze() end to end against a fake connection pool."""
+
+    def test_inline_base64_spliced_without_decode(self):
+        content = b"%PDF-1.7 fake form bytes"
+        gemini = GeminiAnalyzer(api_key="k", system_prompt="sys")
+        gemini._pool = _FakePool('{"dataset_name": "Form", "data": {"name": "Root"}}')
+
+        result = gemini.analyze(file_content=content, mime_type="application/pdf")
+
+        assert result.dataset_name == "Form"
+        method, path, body, _ = gemini._pool.requests[0]
+        assert method == "POST"
+        assert path.endswith(":generateContent?key=k")
+        assert isinstance(body, bytearray)
+        assert b'"data":"' + base64.standard_b64encode(content) + b'"' in body
+        inline = json.loads(body)["contents"][0]["parts"][0]["inlineData"]
+        assert base64.b64decode(inline["data"]) == content
+
+    def test_fenced_response(self):
+        gemini = GeminiAnalyzer(api_key="k", system_prompt="sys")
+        gemini._pool = _FakePool('```json\n{"dataset_name": "F", "data": {"name": "R"}}\n```')
+        assert gemini.analyze(file_content=b"x").data.name == "R"
+
+    @pytest.mark.parametrize(
+        "name, mime_type",
+        [
+            ("form.pdf", "application/pdf"),
+            ("FORM.PDF", "application/pdf"),
+            ("scan.png", "image/png"),
+            (".pdf", "application/octet-stream"),  # dotfile, no suffix
+        ],
+    )
+    def test_mime_type_from_file_name(self, tmp_path, name, mime_type):
+        path = tmp_path / name
+        path.write_bytes(b"x")
+        gemini = GeminiAnalyzer(api_key="k", system_prompt="sys")
+        gemini._pool = _FakePool('{"dataset_name": "F", "data": {"name": "R"}}')
+        gemini.analyze(file_path=path)
+        _, _, body, _ = gemini._pool.requests[0]
+        inline = json.loads(body)["contents"][0]["parts"][0]["inlineData"]
+        assert inline["mimeType"] == mime_type
+
+
+class TestUpload:
+    """Test the Files API path for content above upload_threshold."""
+
+    RESULT = '{"dataset_name": "F", "data": {"name": "R"}}'
+    CONTENT = b"%PDF-1.7 " + bytes(range(256)) * 8
+
+    def _analyzer(self, pool):
+        gemini = GeminiAnalyzer(api_key="k", system_prompt="sys", upload_threshold=1024)
+        gemini._pool = pool
+        return gemini
+
+    def test_upload_generate_delete(self):
+        pool = _FakePool(self.RESULT)
+        result = self._analyzer(pool).analyze(
+            file_content=self.CONTENT, mime_type="application/pdf"
+        )
+        assert result.data.name == "R"
+        (start, upload, generate, delete) = pool.requests
+        assert start[0] == "POST" and start[1] == "/upload/v1beta/files?key=k"
+        assert start[3]["X-Goog-Upload-Command"] == "start"
+        assert start[3]["X-Goog-Upload-Header-Content-Length"] == str(len(self.CONTENT))
+        assert upload[1] == "/upload/v1beta/files?upload_id=u1"
+        assert upload[2] == self.CONTENT
+        assert upload[3]["X-Goog-Upload-Command"] == "upload, finalize"
+        parts = json.loads(generate[2])["contents"][0]["parts"]
+        assert parts[0] == {
+            "fileData": {"mimeType": "application/pdf", "fileUri": _FakePool.FILE["uri"]}
+        }
+        assert delete[:2] == ("DELETE", "/v1beta/files/abc?key=k")
+
+    def test_small_content_stays_inline(self):
+        pool = _FakePool(self.RESULT)
+        self._analyzer(pool).analyze(file_content=b"tiny")
+        assert [r[0] for r in pool.requests] == ["POST"]
+
+    def test_upload_url_on_other_host_rejected(self):
+        pool = _FakePool(self.RESULT, upload_url="https://evil.example/upload?upload_id=u1")
+        with pytest.raises(RuntimeError, match="Unexpected Gemini upload URL"):
+            self._analyzer(pool).analyze(file_content=self.CONTENT)
+        assert len(pool.requests) == 1  # content never sent
+
+    def test_file_deleted_when_generate_fails(self, monkeypatch):
+        monkeypatch.setattr(analyzer.time, "sleep", lambda _: None)
+        pool = _FakePool(self.RESULT, errors=[(400, {})])
+        with pytest.raises(RuntimeError, match="Gemini API error 400"):
+            self._analyzer(pool).analyze(file_content=self.CONTENT)
+        assert pool.requests[-1][:2] == ("DELETE", "/v1beta/files/abc?key=k")
+
+
+class TestRetry:
+    """Test retry with backoff on transient Gemini statuses."""
+
+    RESULT = '{"dataset_name": "F", "data": {"name": "R"}}'
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(analyzer.time, "sleep", calls.append)
+        return calls
+
+    def test_retries_then_succeeds(self, sleeps):
+        gemini = GeminiAnalyzer(api_key="k", system_prompt="sys")
+        gemini._pool = _FakePool(self.RESULT, errors=[(503, {}), (429, {}), (500, {})])
+        assert gemini.analyze(file_content=b"x").data.name == "R"
+        assert len(gemini._pool.requests) == 4
+        assert sleeps == [0.5, 1.0, 2.0]
+
+    def test_honors_retry_after(self, sleeps):
+        gemini = GeminiAnalyzer(api_key="k", system_prompt="sys")
+        gemini._pool = _FakePool(self.RESULT, errors=[(429, {"Retry-After": "3"})])
+        gemini.analyze(file_content=b"x")
+        assert sleeps == [3.0]
+
+    def test_gives_up_after_max_retries(self, sleeps):
+        gemini = GeminiAnalyzer(api_key="k", system_prompt="sys", max_retries=2)
+        gemini._pool = _FakePool(self.RESULT, errors=[(503, {})] * 5)
+        with pytest.raises(RuntimeError, match="Gemini API error 503"):
+            gemini.analyze(file_content=b"x")
+        assert len(gemini._pool.requests) == 3
+
+    def test_client_errors_not_retried(self, sleeps):
+        gemini = GeminiAnalyzer(api_key="k", system_prompt="sys")
+        gemini._pool = _FakePool(self.RESULT, errors=[(400, {})])
+        with pytest.raises(RuntimeError, match="Gemini API error 400"):
+            gemini.analyze(file_content=b"x")
+        assert sleeps == []
+
+
+class _FakeResponse:
+    """Response whose readinto returns at most ``chunk`` bytes per call."""
+
+    def __init__(
+        self, body=b"{}", will_close=False, length=None, chunk=None, headers=None
+    ):
+        self.status = 200
+        self.headers = http.client.HTTPMessage()
+        for name, value in (headers or {}).items():
+            self.headers[name] = value
+        self.length = len(body) if length is None else length
+        self.will_close = will_close
+        self._body = body
+        self._chunk = chunk or len(body)
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+    def readinto(self, view):
+        n = min(len(view), len(self._body), self._chunk)
+        view[:n] = self._body[:n]
+        self._body = self._body[n:]
+        return n
+
+
+class TestReadBody:
+    """Test reading a response body into a pre-sized buffer."""
+
+    def test_short_reads_assemble_full_body(self):
+        resp = _FakeResponse(b"0123456789", chunk=3)
+        assert _read_body(resp) == b"0123456789"
+
+    def test_premature_end_raises_incomplete_read(self):
+        resp = _FakeResponse(b"0123", length=10)
+        with pytest.raises(http.client.IncompleteRead) as excinfo:
+            _read_body(resp)
+        assert excinfo.value.partial == b"0123"
+        assert excinfo.value.expected == 6
+
+
+class _FakeConnection:
+    """Stands in for http.client.HTTPSConnection; records its lifecycle."""
+
+    created = []
+
+    def __init__(self, host, port=None, timeout=None):
+        self.host, self.port = host, port
+        self.tunnel = None
+        self.closed = False
+        self.fail_next = None
+        self.will_close = False
+        self.requests = 0
+        self.sent_headers = None
+        self.response = {}
+        _FakeConnection.created.append(self)
+
+    def set_tunnel(self, host, port=None, headers=None):
+        self.tunnel = (host, headers)
+
+    def request(self, method, path, body=None, headers=None):
+        self.requests += 1
+        self.sent_headers = headers
+        if self.fail_next is not None:
+            error, self.fail_next = self.fail_next, None
+            raise error
+
+    def getresponse(self):
+        return _FakeResponse(will_close=self.will_close, **self.response)
+
+    def close(self):
+        self.closed = True
+
+
+class TestConnectionPool:
+    """Test connection reuse, stale-connection retry and proxy tunnelling."""
+
+    @pytest.fixture(autouse=True)
+    def fake_connections(self, monkeypatch):
+        for name in ("HTTPS_PROXY", "https_proxy", "NO_PROXY", "no_proxy"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setattr(http.client, "HTTPSConnection", _FakeConnection)
+        _FakeConnection.created = []
+
+    def test_connection_released_and_reused(self):
+        pool = _ConnectionPool("example.com")
+        pool.request("GET", "/", b"", {})
+        pool.request("GET", "/", b"", {})
+        (conn,) = _FakeConnection.created
+        assert conn.requests == 2 and not conn.closed
+        pool.close()
+        assert conn.closed
+
+    def test_closing_response_not_pooled(self):
+        pool = _ConnectionPool("example.com")
+        pool.request("GET", "/", b"", {})
+        first = _FakeConnection.created[0]
+        first.will_close = True
+        pool.request("GET", "/", b"", {})
+        assert first.closed
+        pool.request("GET", "/", b"", {})
+        assert len(_FakeConnection.created) == 2
+
+    def test_gzip_response_decompressed(self):
+        pool = _ConnectionPool("example.com")
+        conn = pool._new_connection()
+        conn.response = {
+            "body": gzip.compress(b'{"ok": true}'),
+            "headers": {"Content-Encoding": "gzip"},
+        }
+        pool._release(conn)
+        _, _, data = pool.request("POST", "/", b"", {"X-Test": "1"})
+        assert conn.sent_headers == {"Accept-Encoding": "gzip", "X-Test": "1"}
+        assert json.loads(data) == {"ok": True}
+
+    def test_pool_full_closes_extra_connection(self):
+        pool = _ConnectionPool("example.com", maxsize=1)
+        conns = [pool._new_connection() for _ in range(2)]
+        for conn in conns:
+            pool._release(conn)
+        assert not conns[0].closed and conns[1].closed
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            http.client.RemoteDisconnected("idle connection closed"),
+            ConnectionResetError(),
+            ConnectionAbortedError(),  # Windows
+            BrokenPipeError(),
+        ],
+    )
+    def test_stale_reused_connection_retried_once(self, error):
+        pool = _ConnectionPool("example.com")
+        pool.request("GET", "/", b"", {})
+        stale = _FakeConnection.created[0]
+        stale.fail_next = error
+        status, _, _ = pool.request("GET", "/", b"", {})
+        assert status == 200
+        assert stale.closed
+        assert len(_FakeConnection.created) == 2
+
+    def test_stale_error_on_fresh_connection_raises(self, monkeypatch):
+        class _Dropping(_FakeConnection):
+            def request(self, *args, **kwargs):
+                raise http.client.RemoteDisconnected("closed")
+
+        monkeypatch.setattr(http.client, "HTTPSConnection", _Dropping)
+        pool = _ConnectionPool("example.com")
+        with pytest.raises(http.client.RemoteDisconnected):
+            pool.request("GET", "/", b"", {})
+        (conn,) = _FakeConnection.created
+        assert conn.closed
+
+    def test_https_proxy_tunnel(self, monkeypatch):
+        monkeypatch.setenv("HTTPS_PROXY", "http://us%40r:pw@proxy.local:3128")
+        pool = _ConnectionPool("example.com")
+        conn = pool._new_connection()
+        assert (conn.host, conn.port) == ("proxy.local", 3128)
+        host, headers = conn.tunnel
+        assert host == "example.com"
+        assert headers["Proxy-Authorization"] == (
+            "Basic " + base64.b64encode(b"us@r:pw").decode("ascii")
+        )
+
+    def test_no_proxy_bypass(self, monkeypatch):
+        monkeypatch.setenv("HTTPS_PROXY", "proxy.local:3128")
+        monkeypatch.setenv("NO_PROXY", "example.com")
+        assert _https_proxy_for("example.com") is None
+        assert _https_proxy_for("other.org") == ("proxy.local", 3128, {})
+
+    def test_proxy_without_port(self, monkeypatch):
+        """A port-less proxy defaults to 443, as urlopen does for HTTPS."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.local")
+        assert _https_proxy_for("example.com") == ("proxy.local", 443, {})
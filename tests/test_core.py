@@ -0,0 +1,90 @@
+"""Tests for form2sdc.core pipeline orchestration (no LLM calls)."""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from form2sdc.core import FormToTemplatePipeline, PipelineResult
+from form2sdc.types import ClusterDefinition, ColumnDefinition, ColumnType, FormAnalysis
+
+
+class _FakeAnalyzer:
+    """Analyzer stub that names the dataset after the input file."""
+
+    def __init__(self, delay: float = 0.0, fail: frozenset = frozenset()):
+        self.delay = delay
+        self.fail = fail  # file stems whose analysis raises
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def analyze(self, file_path=None, file_content=None, mime_type=None,
+                additional_instructions=""):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+            self.calls += 1
+        if Path(file_path).stem in self.fail:
+            raise RuntimeError(f"analysis failed: {file_path}")
+        return FormAnalysis(
+            dataset_name=Path(file_path).stem,
+            data=ClusterDefinition(
+                name="Root",
+                description="Root cluster",
+                columns=[
+                    ColumnDefinition(
+                        name="Full Name",
+                        column_type=ColumnType.TEXT,
+                        description="Name",
+                    )
+                ],
+            ),
+        )
+
+
+class TestProcessMany:
+    def test_results_in_input_order(self):
+        pipeline = FormToTemplatePipeline(_FakeAnalyzer())
+        paths = [Path(f"form_{i}.pdf") for i in range(5)]
+        results = pipeline.process_many(paths)
+        assert all(isinstance(r, PipelineResult) for r in results)
+        assert [r.analysis.dataset_name for r in results] == [p.stem for p in paths]
+        assert all(r.valid for r in results)
+        assert results[0].validation.metadata["document"] == "form_0.pdf"
+
+    def test_analyzer_calls_run_concurrently(self):
+        analyzer = _FakeAnalyzer(delay=0.05)
+        pipeline = FormToTemplatePipeline(analyzer)
+        pipeline.process_many([Path(f"f{i}.pdf") for i in range(4)], concurrency=4)
+        assert analyzer.max_active > 1
+
+    def test_concurrency_limit(self):
+        analyzer = _FakeAnalyzer(delay=0.02)
+        pipeline = FormToTemplatePipeline(analyzer)
+        pipeline.process_many([Path(f"f{i}.pdf") for i in range(6)], concurrency=2)
+        assert analyzer.max_active <= 2
+
+    def test_empty_input(self):
+        pipeline = FormToTemplatePipeline(_FakeAnalyzer())
+        assert pipeline.process_many([]) == []
+
+    def test_failure_raises_after_all_analyses(self):
+        analyzer = _FakeAnalyzer(fail=frozenset({"f1", "f3"}))
+        pipeline = FormToTemplatePipeline(analyzer)
+        with pytest.raises(RuntimeError, match="f1.pdf"):
+            pipeline.process_many([Path(f"f{i}.pdf") for i in range(5)])
+        assert analyzer.calls == 5
+
+    def test_return_exceptions_keeps_successful_results(self):
+        pipeline = FormToTemplatePipeline(_FakeAnalyzer(fail=frozenset({"f1"})))
+        results = pipeline.process_many(
+            [Path(f"f{i}.pdf") for i in range(3)], return_exceptions=True
+        )
+        assert isinstance(results[1], RuntimeError)
+        assert [r.analysis.dataset_name for r in (results[0], results[2])] == ["f0", "f2"]
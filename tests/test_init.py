@@ -0,0 +1,38 @@
+"""Tests for the lazy public API of the form2sdc package."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _run(code):
+    """Run ``code`` in a fresh interpreter, so no submodule is preloaded."""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_import_does_not_load_dependencies():
+    _run(
+        "import sys, form2sdc\n"
+        "loaded = {m.split('.')[0] for m in sys.modules}\n"
+        "assert not loaded & {'pydantic', 'yaml'}, loaded\n"
+    )
+
+
+def test_public_names_resolve_lazily():
+    _run(
+        "import importlib, form2sdc\n"
+        "for name in form2sdc.__all__:\n"
+        "    assert name in dir(form2sdc), name\n"
+        "    assert name not in vars(form2sdc), name\n"
+        "    module = importlib.import_module(form2sdc._LAZY_IMPORTS[name])\n"
+        "    assert getattr(form2sdc, name) is getattr(module, name), name\n"
+        "    assert name in vars(form2sdc), name\n"
+    )
+
+
+def test_unknown_name_raises_attribute_error():
+    import form2sdc
+
+    with pytest.raises(AttributeError, match="no_such_name"):
+        form2sdc.no_such_name
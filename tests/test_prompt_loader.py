@@ -0,0 +1,50 @@
+"""Tests for form2sdc.prompt_loader (no network)."""
+
+from pathlib import Path
+
+import pytest
+
+from form2sdc.prompt_loader import load_system_prompt
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    load_system_prompt.cache_clear()
+    yield
+    load_system_prompt.cache_clear()
+
+
+@pytest.fixture
+def read_count(monkeypatch):
+    """Count Path.read_text calls made while loading prompts."""
+    calls = []
+    read_text = Path.read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        calls.append(self)
+        return read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    return calls
+
+
+def test_explicit_path_read_once(tmp_path, read_count):
+    path = tmp_path / "Form2SDCTemplate.md"
+    path.write_text("first", encoding="utf-8")
+    assert load_system_prompt(path) == "first"
+    path.write_text("second", encoding="utf-8")
+    assert load_system_prompt(path) == "first"
+    assert len(read_count) == 1
+
+    load_system_prompt.cache_clear()
+    assert load_system_prompt(path) == "second"
+
+
+def test_default_prompt_read_once(read_count):
+    assert load_system_prompt() is load_system_prompt()
+    assert len(read_count) == 1
+
+
+def test_missing_explicit_path(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_system_prompt(tmp_path / "missing.md")
@@ -1,8 +1,11 @@
 """Tests for form2sdc.template_builder including round-trip validation."""
 
+import io
+
 import pytest
+import yaml
 
-from form2sdc.template_builder import TemplateBuilder
+from form2sdc.template_builder import DEFAULT_BUILDER, TemplateBuilder, build
 from form2sdc.validator import Form2SDCValidator
 from form2sdc.types import (
     AttestationDefinition,
@@ -55,6 +58,17 @@ class TestFrontMatter:
         assert '  creator: "Test Author"' in result
         assert 'domain: "Healthcare"' in result
 
+    def test_description_escaping_round_trips(self, builder):
+        description = 'Says "hi"\\n with C:\\path\nand a second line'
+        analysis = FormAnalysis(
+            dataset_name="Test",
+            dataset_description=description,
+            data=ClusterDefinition(name="Root"),
+        )
+        result = builder.build(analysis)
+        front_matter = yaml.safe_load(result.split("---\n")[1])
+        assert front_matter["dataset"]["description"] == description
+
 
 class TestDataSection:
     """Test Data section rendering (was root cluster)."""
@@ -198,6 +212,24 @@ class TestColumnRendering:
         assert "**Temporal Type**: date" in result
         assert "**Min Date**: 1900-01-01" in result
 
+    def test_constraints_sharing_shape_and_set_later(self, builder):
+        first = Constraint(min_length=0, pattern="^[A-Z]+$")
+        second = Constraint(min_length=3, pattern=None)
+        second.max_length = 9
+        analysis = FormAnalysis(
+            dataset_name="Test",
+            data=ClusterDefinition(
+                name="Root",
+                columns=[
+                    ColumnDefinition(name="A", column_type="text", constraints=first),
+                    ColumnDefinition(name="B", column_type="text", constraints=second),
+                ],
+            ),
+        )
+        result = builder.build(analysis)
+        assert "**Pattern**: ^[A-Z]+$\n**Min Length**: 0\n" in result
+        assert "### B\n\n**Type**: XdString\n**Min Length**: 3\n**Max Length**: 9\n" in result
+
     def test_reuse_component(self, builder):
         analysis = FormAnalysis(
             dataset_name="Test",
@@ -216,6 +248,13 @@ class TestColumnRendering:
         result = builder.build(analysis)
         assert "**ReuseComponent**: @NIEM:StateUSPostalServiceCode" in result
 
+    @pytest.mark.parametrize("level", [2, 6, 8])
+    def test_column_heading_level(self, builder, level):
+        buf = io.StringIO()
+        col = ColumnDefinition(name="Deep", column_type=ColumnType.TEXT)
+        builder._render_column(buf, col, level=level)
+        assert buf.getvalue().startswith("#" * level + " Deep\n\n")
+
 
 class TestPartyRendering:
     """Test Subject/Provider/Participation rendering."""
@@ -263,6 +302,22 @@ class TestPartyRendering:
         assert "**Function**: Clinician" in result
         assert "**Mode**: In-Person" in result
 
+    def test_participation_descriptions_only(self, builder):
+        analysis = FormAnalysis(
+            dataset_name="Test",
+            data=ClusterDefinition(name="Root"),
+            participations=[
+                PartyDefinition(
+                    name="Witness",
+                    party_type="participation",
+                    mode_description="Remote",
+                )
+            ],
+            workflow=ClusterDefinition(name="Flow"),
+        )
+        result = builder.build(analysis)
+        assert "**Mode Description**: Remote\n\n## Workflow: Flow" in result
+
 
 class TestWorkflowRendering:
     """Test Workflow section rendering."""
@@ -535,3 +590,18 @@ class TestRoundTrip:
             f"Round-trip validation failed with errors: "
             f"{[e.message for e in result.errors]}"
         )
+
+
+class TestDefaultBuilder:
+    """Test the shared module-level builder."""
+
+    def test_build_uses_default_builder(self):
+        analysis = FormAnalysis(
+            dataset_name="Test",
+            data=ClusterDefinition(name="Root"),
+        )
+        assert build(analysis) == TemplateBuilder().build(analysis)
+        assert DEFAULT_BUILDER.build(analysis) == build(analysis)
+
+    def test_builder_has_no_instance_dict(self):
+        assert not hasattr(TemplateBuilder(), "__dict__")
@@ -13,7 +13,9 @@ from form2sdc.types import (
     EnumerationItem,
     FormAnalysis,
     PartyDefinition,
+    parse_form_analysis,
     resolve_sdc4_type,
+    resolve_sdc4_type_enum,
     FRIENDLY_TO_SDC4,
 )
 
@@ -60,6 +62,14 @@ class TestResolveSdc4Type:
         assert resolve_sdc4_type("Cluster") == "Cluster"
         assert resolve_sdc4_type("XdOrdinal") == "XdOrdinal"
 
+    def test_mapping_is_read_only(self):
+        with pytest.raises(TypeError):
+            FRIENDLY_TO_SDC4["text"] = "XdToken"
+
+    def test_enum_matches_string_resolution(self):
+        for ct in ColumnType:
+            assert resolve_sdc4_type_enum(ct) == resolve_sdc4_type(ct.value)
+
 
 class TestConstraint:
     """Test Constraint model."""
@@ -235,6 +245,17 @@ class TestAuditDefinition:
 class TestFormAnalysis:
     """Test FormAnalysis model."""
 
+    def test_parse_form_analysis(self):
+        raw = '{"dataset_name": "T", "data": {"name": "R", "columns": [{"name": "a", "column_type": "date"}]}}'
+        analysis = parse_form_analysis(raw)
+        assert isinstance(analysis, FormAnalysis)
+        assert analysis == FormAnalysis.model_validate_json(raw)
+        assert parse_form_analysis(raw.encode()).data.columns[0].column_type is ColumnType.DATE
+
+    def test_parse_form_analysis_rejects_invalid(self):
+        with pytest.raises(ValidationError):
+            parse_form_analysis('{"dataset_name": "T"}')
+
     def test_minimal_analysis(self):
         analysis = FormAnalysis(
             dataset_name="Test",
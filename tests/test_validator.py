@@ -276,6 +276,57 @@ source_language: "English"
         assert result.valid is False
         assert any(e.code == "E-DOC-002" for e in result.errors)
 
+    def test_invalid_yaml_message_quotes_source(self, validator):
+        """E-DOC-002 messages quote the offending source line."""
+        content = """---
+dataset:
+  name: "Test
+source_language: "English"
+---
+
+## Data: Root
+
+**Type**: Cluster
+"""
+        (error,) = [e for e in validator.validate(content).errors if e.code == "E-DOC-002"]
+        assert error.line == 4
+        assert 'source_language: "English"' in error.message
+
+    def test_tab_after_colon_is_invalid_yaml(self, validator):
+        """A tab before a quoted value is rejected, as PyYAML's SafeLoader does."""
+        content = """---
+template_version: "1.0.0"
+dataset:
+  name: "Test"
+source_language:\t"English"
+---
+
+## Data: Root
+
+**Type**: Cluster
+"""
+        result = validator.validate(content)
+        assert result.valid is False
+        assert [e.code for e in result.errors] == ["E-DOC-002"]
+
+    def test_repeated_front_matter_revalidates_identically(self, validator):
+        """Memoized front matter parsing gives the same issues every time."""
+        content = """---
+template_version: "1.0.0"
+dataset:
+  name: "Test"
+source_language: "English"
+---
+
+## Data: Root
+
+**Type**: Cluster
+"""
+        first = validator.validate(content)
+        second = validator.validate(content)
+        assert first.valid is second.valid is True
+        assert (first.warnings, first.suggestions) == (second.warnings, second.suggestions)
+
     def test_empty_body(self, validator):
         """E-DOC-006: Empty body after front matter."""
         content = """---
@@ -381,6 +432,39 @@ source_language: "English"
         assert result.valid is False
         assert any(e.code == "E-CMP-001" for e in result.errors)
 
+    @pytest.mark.parametrize(
+        "name, suggested",
+        [
+            ("Patient Name", "XdString"),
+            ("BIRTH_COUNT", "XdCount"),
+            ("Is_Active", "XdBoolean"),
+            ("Statut du ſtatus", "XdOrdinal"),  # non-ASCII: Unicode case folding
+            ("Gewicht", None),
+        ],
+    )
+    def test_missing_type_suggestion(self, validator, name, suggested):
+        """E-CMP-001 fix suggests a type from the name, ignoring case."""
+        content = f"""---
+template_version: "1.0.0"
+dataset:
+  name: "Test"
+source_language: "English"
+---
+
+## Data: Root
+
+**Type**: Cluster
+
+### {name}
+
+**Description**: d
+"""
+        (error,) = [e for e in validator.validate(content).errors if e.code == "E-CMP-001"]
+        if suggested:
+            assert error.fix.endswith(f"(suggestion: {suggested})")
+        else:
+            assert "suggestion" not in error.fix
+
 
 class TestBusinessLogic:
     """E-BIZ-002 through E-BIZ-007 tests."""
@@ -500,6 +584,29 @@ source_language: "English"
         assert result.valid is False
         assert any(e.code == "E-BIZ-007" for e in result.errors)
 
+    def test_invalid_regex_pattern_reported_on_revalidation(self, validator):
+        """E-BIZ-007 still fires when the failed compile comes from cache."""
+        content = """---
+template_version: "1.0.0"
+dataset:
+  name: "Test"
+source_language: "English"
+---
+
+## Data: Root
+
+**Type**: Cluster
+
+### Code
+
+**Type**: XdString
+**Pattern**: (a|b
+"""
+        first = [e for e in validator.validate(content).errors if e.code == "E-BIZ-007"]
+        second = [e for e in validator.validate(content).errors if e.code == "E-BIZ-007"]
+        assert len(first) == 1
+        assert second == first
+
 
 class TestSyntaxErrors:
     """E-SYN-002, E-SYN-003 tests."""
@@ -1012,3 +1119,70 @@ dataset:
         assert result.metadata["critical_count"] == len(result.errors)
         assert result.metadata["warning_count"] == len(result.warnings)
         assert result.metadata["suggestion_count"] == len(result.suggestions)
+
+    def test_result_objects_are_slotted(self, validator, valid_minimal_template):
+        """Results and issues carry no per-instance __dict__."""
+        result = validator.validate(valid_minimal_template)
+        assert not hasattr(result, "__dict__")
+        assert all(not hasattr(issue, "__dict__") for issue in result.warnings)
+
+    def test_results_do_not_share_issue_lists(self, validator):
+        """A later validate() call leaves earlier results untouched."""
+        first = validator.validate("no front matter")
+        errors = list(first.errors)
+        validator.validate("still no front matter")
+        assert first.errors == errors
+        assert first.metadata["critical_count"] == len(first.errors) == 1
+
+
+class TestSubclassing:
+    """Overrides in Form2SDCValidator subclasses are honoured."""
+
+    def test_type_validator_override(self, valid_minimal_template):
+        """Type-specific checks dispatch through the instance."""
+        calls = []
+
+        class Recording(Form2SDCValidator):
+            def _validate_cluster_type(self, comp):
+                calls.append(comp.name)
+
+        Recording().validate(valid_minimal_template)
+        assert calls
+
+    def test_type_suggestion_override(self):
+        """E-CMP-001 type suggestions come from the instance method."""
+
+        class Suggesting(Form2SDCValidator):
+            def _suggest_type_from_name(self, name):
+                return "XdLink"
+
+        content = """---
+template_version: "1.0.0"
+dataset:
+  name: "Test"
+source_language: "English"
+---
+
+## Data: Root
+
+**Type**: Cluster
+
+### Patient Name
+
+**Description**: d
+"""
+        (error,) = [
+            e for e in Suggesting().validate(content).errors if e.code == "E-CMP-001"
+        ]
+        assert error.fix.endswith("(suggestion: XdLink)")
+
+    def test_front_matter_mutation_does_not_leak(self, valid_minimal_template):
+        """Mutating the front matter leaves later validations untouched."""
+
+        class Mutating(Form2SDCValidator):
+            def _validate_front_matter(self, fm):
+                fm["dataset"].pop("name")
+                super()._validate_front_matter(fm)
+
+        assert not Mutating().validate(valid_minimal_template).valid
+        assert Form2SDCValidator().validate(valid_minimal_template).valid